@@ -16,7 +16,7 @@ from app.infrastructures.database import Base
 
 # Import all models để Alembic có thể auto-detect changes
 from app.models import *  # This imports all models
-from app.models.abstract_model import AbstractModel
+from app.models.abstract_model import AbstractModel, index_applies
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -36,6 +36,15 @@ if database_url:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Skip the live row indexes meant for another dialect (partial index vs deleted_at prefixed index).
+    """
+    if type_ == "index" and not reflected:
+        return index_applies(object, context.get_context().dialect.name)
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -60,6 +69,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -81,7 +91,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,56 @@
+"""Add users indexes
+
+Revision ID: 5445b85ec1a4
+Revises: 043ea57085e0
+Create Date: 2026-10-16 10:12:41.208531
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5445b85ec1a4'
+down_revision: Union[str, Sequence[str], None] = '043ea57085e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same definitions as AbstractModel.__live_indexes__, kept literal so the migration does not change with the models
+LIVE_INDEXES = (("id",), ("created_at", "id"))
+PARTIAL_INDEX_DIALECTS = ("postgresql", "sqlite")
+
+
+def _live_index_names():
+    partial = op.get_bind().dialect.name in PARTIAL_INDEX_DIALECTS
+    for columns in LIVE_INDEXES:
+        suffix = "_".join(columns)
+        if partial:
+            yield f"ix_users_live_{suffix}", list(columns), partial
+        else:
+            yield f"ix_users_deleted_at_{suffix}", ["deleted_at", *columns], partial
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Soft delete filtering (deleted_at IS NULL) and the default orderings of the listings
+    for name, columns, partial in _live_index_names():
+        if partial:
+            op.create_index(
+                name, "users", columns,
+                postgresql_where=sa.text("deleted_at IS NULL"),
+                sqlite_where=sa.text("deleted_at IS NULL"),
+            )
+        else:
+            op.create_index(name, "users", columns)
+
+    # Session token lookup of every authenticated request (email is already covered by its unique constraint)
+    op.create_index("ix_users_token", "users", ["token"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_token", table_name="users")
+    for name, _, _ in _live_index_names():
+        op.drop_index(name, table_name="users")
@@ -1,13 +1,24 @@
+import csv
+import io
+import json
 from abc import abstractmethod, ABC
 
 from fastapi import APIRouter
 from fastapi.encoders import jsonable_encoder
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, StreamingResponse
 
 from app.core.service_containers.service_containers import get_registry
 
 
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
 class BaseController(ABC):
+    # Rows written per chunk of a streamed response
+    stream_chunk_rows = 500
+
     def __init__(self):
         self.router = APIRouter()
         self.registry = get_registry()
@@ -20,12 +31,13 @@ class BaseController(ABC):
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
-    def success(self, content=None, message="Success", status_code=200):
+    def success(self, content=None, message="Success", status_code=200, pagination=None):
         """
         Defines base API response structures for success messages.
         :param content: Optional data to include in the response.
         :param message: Optional message to include in the response.
         :param status_code: HTTP status code for the response, default is 200.
+        :param pagination: Optional pagination metadata (next_cursor, has_more...) added to the envelope.
         """
         content = {
                 "status_code": status_code,
@@ -34,9 +46,25 @@ class BaseController(ABC):
                 "message": message,
                 "data": jsonable_encoder(content)
             }
+        if pagination is not None:
+            content["pagination"] = jsonable_encoder(pagination)
 
         return JSONResponse(status_code=status_code, content=content)
 
+    def paginated(self, page, message="Success", status_code=200):
+        """
+        Success response for a Page: the items as data and the cursor in the pagination field.
+        :param page: Page returned by a service get_page().
+        """
+        pagination = {
+            "next_cursor": page.next_cursor,
+            "has_more": page.has_more,
+        }
+        if page.total is not None:
+            pagination["total"] = page.total
+            pagination["total_estimated"] = page.total_estimated
+        return self.success(content=page.items, message=message, status_code=status_code, pagination=pagination)
+
     def error(self, message="Error", status_code=400):
         """
         Defines base API response structures for error messages.
@@ -50,4 +78,70 @@ class BaseController(ABC):
             "message": message,
             "data": None
         }
-        return JSONResponse(status_code=status_code, content=content)
\ No newline at end of file
+        return JSONResponse(status_code=status_code, content=content)
+
+    def stream(self, items, format="ndjson", filename=None, status_code=200):
+        """
+        Stream items (a sync or async iterator, e.g. a service stream()) as NDJSON or CSV.
+        Rows are encoded as they are produced, so memory stays constant and the first bytes are sent immediately.
+        :param items: Iterator or AsyncIterator of pydantic models or dicts.
+        :param format: "ndjson" or "csv".
+        :param filename: Optional download file name (Content-Disposition: attachment).
+        """
+        if format not in STREAM_MEDIA_TYPES:
+            return self.error(message=f"Unsupported stream format: {format}")
+
+        encode = self._encode_ndjson if format == "ndjson" else self._csv_encoder()
+        chunk_rows = self.stream_chunk_rows
+
+        if hasattr(items, '__aiter__'):
+            async def body():
+                chunk = []
+                async for item in items:
+                    chunk.append(encode(item))
+                    if len(chunk) >= chunk_rows:
+                        yield ''.join(chunk)
+                        chunk = []
+                if chunk:
+                    yield ''.join(chunk)
+        else:
+            def body():
+                chunk = []
+                for item in items:
+                    chunk.append(encode(item))
+                    if len(chunk) >= chunk_rows:
+                        yield ''.join(chunk)
+                        chunk = []
+                if chunk:
+                    yield ''.join(chunk)
+
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'} if filename else None
+        return StreamingResponse(body(), status_code=status_code, media_type=STREAM_MEDIA_TYPES[format], headers=headers)
+
+    @staticmethod
+    def _encode_ndjson(item) -> str:
+        if hasattr(item, 'model_dump_json'):
+            return item.model_dump_json() + "\n"
+        return json.dumps(jsonable_encoder(item)) + "\n"
+
+    @staticmethod
+    def _csv_encoder():
+        """
+        CSV row encoder writing the header before the first row.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        header = []
+
+        def encode(item) -> str:
+            row = jsonable_encoder(item)
+            if not header:
+                header.extend(row.keys())
+                writer.writerow(header)
+            writer.writerow([row.get(key) for key in header])
+            line = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return line
+
+        return encode
@@ -1,37 +1,62 @@
 from abc import ABC
+from typing import Optional, Literal
+
+from fastapi import Query
 
 from app.api.v1.controllers.base_controller import BaseController
 from app.core.decorators.di import controller, inject
 from app.schemas.models.user.user_create_schema import UserCreateSchema
 from app.schemas.responses.user.user_response_schema import UserResponseSchema
-from app.services.interfaces.user.i_user_service import IUserService
+from app.services.interfaces.user.i_async_user_service import IAsyncUserService
 
 @controller
 @inject
 class UserAccountController(BaseController, ABC):
-    def __init__(self, user_service: IUserService):
+    def __init__(self, user_service: IAsyncUserService):
         super().__init__()
         self.user_service = user_service
 
     def define_routes(self):
         self.router.get("/", summary="Get All Users", response_model=list[UserResponseSchema], status_code=200)(self.index)
+        self.router.get("/export", summary="Export Users (NDJSON / CSV stream)", status_code=200)(self.export)
         self.router.post("/register", summary="Register User", response_model=UserResponseSchema, status_code=200)(self.register_user)
 
-    def index(self):
+    async def index(
+            self,
+            limit: int = Query(20, ge=1, le=100),
+            cursor: Optional[str] = None,
+            order_by: Literal["id", "created_at"] = "id",
+            order_direction: Literal["asc", "desc"] = "asc",
+            total: Literal["exact", "estimated", "none"] = "estimated",
+    ):
+        """
+        List users page by page. Pass the returned pagination.next_cursor as cursor to get the next page.
+        :param total: pagination.total from a cached COUNT (exact), from the database statistics when available
+                      (estimated, falls back to the cached COUNT), or not computed (none).
+        """
         try:
-            users = self.user_service.get_all()
-            return self.success(content=users, message="Users retrieved successfully.")
+            page = await self.user_service.get_page(
+                limit, cursor, order_by, order_direction, total=None if total == "none" else total
+            )
+            return self.paginated(page, message="Users retrieved successfully.")
         except Exception as e:
             return self.error(message=str(e))
 
-    def register_user(self, request: UserCreateSchema):
+    async def export(self, format: Literal["ndjson", "csv"] = "ndjson"):
+        """
+        Stream every user without loading them all in memory.
+        :param format: ndjson (one JSON object per line) or csv.
+        """
+        return self.stream(self.user_service.stream(), format=format, filename=f"users.{format}")
+
+    async def register_user(self, request: UserCreateSchema):
         """
         Register a new user account.
         :param request: UserCreateSchema containing user details.
         :return: Response indicating success or failure.
         """
         try:
-            user = self.user_service.create(request)
+            user = await self.user_service.create(request)
             return self.success(content=user, message="User registered successfully.")
         except Exception as e:
             return self.error(message=str(e))
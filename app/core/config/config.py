@@ -1,14 +1,21 @@
 from dynaconf import Dynaconf
 
-from app.core.decorators import component_decorator
+from app.core.decorators.di import component_decorator
 from app.core.paths.config import __config_path__
+from app.core.profiling.startup_profiler import timed, SECTION_INFRASTRUCTURE
 
 @component_decorator
 class Config:
     def __init__(self):
-        self.settings = Dynaconf(
-            settings_files=[f"{__config_path__()}/security.toml"],
-        )
+        with timed(SECTION_INFRASTRUCTURE, "Config.load_settings"):
+            self.settings = Dynaconf(
+                settings_files=[
+                    f"{__config_path__()}/security.toml",
+                    f"{__config_path__()}/database.toml",
+                ],
+            )
+            # Dynaconf is lazy: load the settings files at startup rather than on the first lookup
+            self.settings.as_dict()
 
     def get(self, key: str, default=None):
         """
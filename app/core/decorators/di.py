@@ -1,21 +1,51 @@
+import asyncio
 import inspect
 import logging
+import os
+import threading
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from functools import wraps
-from typing import Type, Optional, Any, Dict, Set, get_type_hints
+from typing import Type, Optional, Any, Awaitable, Dict, Iterator, Set, List, Tuple, get_type_hints
 
+from app.core.profiling.startup_profiler import is_recording, timed, SECTION_COMPONENTS
 from app.core.service_containers.service_containers import get_registry
 
 logger = logging.getLogger(__name__)
 
 _component_registry = {}
 _initialized_components = {}
-_processing_stack = set()
+_resolution_state = threading.local()
 _interface_implementations = {}
 
+# Precompiled resolution plan: cls -> {param_name: (implementation_cls or None, param_type)}
+_resolution_plan: Dict[Type, Dict[str, Tuple[Optional[Type], Any]]] = {}
+_implementation_cache: Dict[Tuple[Any, Optional[str]], Optional[Type]] = {}
+_initialization_order: List[Type] = []
+
+# Lazy components are registered as proxies and built on first attribute access
+_lazy_proxies: Dict[Type, 'LazyComponentProxy'] = {}
+_eager_components: List[Type] = []
+_materialize_lock = threading.RLock()
+
+# One lock per singleton class, so that concurrent resolutions build it once
+_singleton_locks: Dict[Type, threading.RLock] = {}
+_singleton_locks_lock = threading.Lock()
+
+# Request scoped instances of the current HTTP request, in creation order
+_request_instances: ContextVar[Optional[Dict[Type, Any]]] = ContextVar('fastie_request_instances', default=None)
+_request_proxies: Dict[Type, 'RequestScopedProxy'] = {}
+
+# Components whose on_startup hook has run, in the order it ran
+_started_components: List[Type] = []
+DEFAULT_HOOK_TIMEOUT = 30.0
+
 class Scope:
     SINGLETON = "singleton"
     PROTOTYPE = "prototype"
+    REQUEST = "request"
 
 def component(cls=None, *, scope: str = Scope.SINGLETON, qualifier: Optional[str] = None, lazy: bool = True):
     def decorator(cls):
@@ -42,6 +72,10 @@ def component(cls=None, *, scope: str = Scope.SINGLETON, qualifier: Optional[str
         for base in cls.__bases__:
             register_for_interfaces(base)
 
+        # A new implementation may change how existing plans resolve
+        _resolution_plan.clear()
+        _implementation_cache.clear()
+
         return cls
 
     if cls is None:
@@ -77,65 +111,218 @@ component_eager = component_decorator
 def service(cls=None, *, scope: str = Scope.SINGLETON, qualifier: Optional[str] = None, lazy: bool = True):
     return component(cls, scope=scope, qualifier=qualifier, lazy=lazy)
 
-def repository(cls=None, *, scope: str = Scope.SINGLETON, qualifier: Optional[str] = None, lazy: bool = True):
-    return component(cls, scope=scope, qualifier=qualifier, lazy=lazy)
+def repository(
+        cls=None,
+        *,
+        scope: str = Scope.SINGLETON,
+        qualifier: Optional[str] = None,
+        lazy: bool = True,
+        identity_cache: Any = False,
+        query_cache: bool = False,
+):
+    """
+    Repository decorator.
+    :param identity_cache: True (or a dict of IdentityCache options: max_size, ttl, negative_ttl)
+                           to cache get_by_id results of this repository
+    :param query_cache: True to serve projected list queries (get_all, get_page) from the query cache
+
+    Usage example:
+    @repository(identity_cache={"max_size": 10000, "ttl": 30})
+    class UserRepository(Repository, IUserRepository):
+        ...
+    """
+    def decorator(cls):
+        if identity_cache:
+            cls.identity_cache_options = {} if identity_cache is True else dict(identity_cache)
+        if query_cache:
+            cls.query_cache_enabled = True
+        return component(cls, scope=scope, qualifier=qualifier, lazy=lazy)
+
+    if cls is None:
+        return decorator
+    return decorator(cls)
 
 def controller(cls=None, *, qualifier: Optional[str] = None):
-    return component(cls, scope=Scope.SINGLETON, qualifier=qualifier, lazy=True)
+    # Controllers are eager: their routers must exist when routes are registered
+    return component(cls, scope=Scope.SINGLETON, qualifier=qualifier, lazy=False)
 
-def _initialize_component(cls):
-    if cls in _processing_stack:
-        raise RuntimeError(f"Circular dependency detected while initializing {cls.__name__}")
-    if cls in _initialized_components:
-        return _initialized_components[cls]
+class _ComponentProxy:
+    """Forward every attribute access to the instance returned by _target()."""
+    __slots__ = ('_proxy_cls',)
 
-    config = _component_registry.get(cls, {'scope': Scope.SINGLETON})
-    scope = config.get('scope', Scope.SINGLETON)
-    qualifier = config.get('qualifier')
+    def __init__(self, cls):
+        object.__setattr__(self, '_proxy_cls', cls)
+
+    def _target(self):
+        raise NotImplementedError
+
+    @property
+    def __class__(self):
+        # Keep isinstance() checks working without building the instance
+        return object.__getattribute__(self, '_proxy_cls')
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._target(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._target(), name)
+
+class LazyComponentProxy(_ComponentProxy):
+    """
+    Stand-in for a lazy component.
+    The real instance (and its dependencies) is built on first attribute access,
+    then every access is forwarded to it.
+    """
+    __slots__ = ('_proxy_instance',)
+
+    def __init__(self, cls):
+        super().__init__(cls)
+        object.__setattr__(self, '_proxy_instance', None)
+
+    def _target(self):
+        instance = object.__getattribute__(self, '_proxy_instance')
+        if instance is None:
+            with _materialize_lock:
+                instance = object.__getattribute__(self, '_proxy_instance')
+                if instance is None:
+                    cls = object.__getattribute__(self, '_proxy_cls')
+                    instance = _initialize_component(cls)
+                    object.__setattr__(self, '_proxy_instance', instance)
+                    logger.info(f"Lazy component {cls.__name__} materialized")
+        return instance
+
+    @property
+    def is_materialized(self) -> bool:
+        return object.__getattribute__(self, '_proxy_instance') is not None
+
+    def __repr__(self):
+        cls = object.__getattribute__(self, '_proxy_cls')
+        instance = object.__getattribute__(self, '_proxy_instance')
+        if instance is None:
+            return f"<LazyComponentProxy {cls.__name__} (pending)>"
+        return repr(instance)
+
+class RequestScopedProxy(_ComponentProxy):
+    """
+    Stand-in for a request scoped component injected into longer-lived components.
+    Every access is forwarded to the instance of the current request scope.
+    """
+    __slots__ = ()
 
-    _processing_stack.add(cls)
+    def _target(self):
+        return _get_request_instance(object.__getattribute__(self, '_proxy_cls'))
 
-    constructor = cls.__init__
-    type_hints = get_type_hints(constructor)
-    params = {}
+    def __repr__(self):
+        return f"<RequestScopedProxy {object.__getattribute__(self, '_proxy_cls').__name__}>"
+
+def _find_implementation(param_type, qualifier: Optional[str] = None) -> Optional[Type]:
+    """
+    Find the registered implementation for an interface.
+    The result (including misses) is cached, so the subclass scan runs once per (type, qualifier).
+    """
+    cache_key = (param_type, qualifier)
+    if cache_key in _implementation_cache:
+        return _implementation_cache[cache_key]
+
+    # A component class can be requested directly
+    if param_type in _component_registry:
+        _implementation_cache[cache_key] = param_type
+        return param_type
+
+    # Try to find implementation for the exact type
+    impl_cls = _interface_implementations.get((param_type, None))
+
+    if not impl_cls:
+        # Try with qualifier
+        impl_cls = _interface_implementations.get((param_type, qualifier))
+
+        # If still not found, check if any registered implementation
+        # is a subclass of the requested interface
+        if not impl_cls:
+            for (iface, qual), implementation in _interface_implementations.items():
+                if issubclass(iface, param_type) and (qual == qualifier or qual is None):
+                    impl_cls = implementation
+                    break
+
+    _implementation_cache[cache_key] = impl_cls
+    return impl_cls
+
+def _plan_component(cls) -> Dict[str, Tuple[Optional[Type], Any]]:
+    """
+    Build (or return the cached) constructor plan of a component.
+    :param cls: component class
+    :return: mapping of parameter name to (implementation class or None, parameter type).
+        A None implementation means the dependency is resolved from the service container.
+    """
+    plan = _resolution_plan.get(cls)
+    if plan is not None:
+        return plan
 
-    for name, param_type in list(type_hints.items()):
+    qualifier = _component_registry.get(cls, {}).get('qualifier')
+    plan = {}
+    for name, param_type in get_type_hints(cls.__init__).items():
         if name == 'return' or name == 'self':
             continue
         try:
-            # Try to find implementation for the exact type
-            key = (param_type, None)
-            impl_cls = _interface_implementations.get(key)
-
-            if not impl_cls:
-                # Try with qualifier
-                key = (param_type, qualifier)
-                impl_cls = _interface_implementations.get(key)
-
-                # If still not found, check if any registered implementation
-                # is a subclass of the requested interface
-                if not impl_cls:
-                    for (iface, qual), implementation in _interface_implementations.items():
-                        if issubclass(iface, param_type) and (qual == qualifier or qual is None):
-                            impl_cls = implementation
-                            break
-
-            if impl_cls:
-                params[name] = _initialize_component(impl_cls)
-            else:
-                # Try resolve from registry
-                registry = get_registry()
-                params[name] = registry.resolve(param_type)
+            plan[name] = (_find_implementation(param_type, qualifier), param_type)
         except Exception as e:
             raise ValueError(f"Failed to resolve dependency '{name}: {param_type}' for {cls.__name__}: {e}")
 
-    instance = cls(**params)
-    _processing_stack.remove(cls)
+    _resolution_plan[cls] = plan
+    return plan
 
-    if scope == Scope.SINGLETON:
-        _initialized_components[cls] = instance
-
-    # Register in the service container
+def build_resolution_plan(roots: Optional[List[Type]] = None) -> List[Type]:
+    """
+    Compute the resolution plan of every registered component and sort it topologically.
+    Circular dependencies are reported here, before any component is constructed.
+    :param roots: components to start from (in priority order), defaults to all registered components
+    :return: components ordered so that every dependency comes before its dependents
+    """
+    order = []
+    visited = set()
+    visiting = []
+
+    def visit(cls):
+        if cls in visited:
+            return
+        if cls in visiting:
+            cycle = visiting[visiting.index(cls):] + [cls]
+            raise RuntimeError(
+                "Circular dependency detected: " + " -> ".join(c.__name__ for c in cycle)
+            )
+
+        visiting.append(cls)
+        for impl_cls, _ in _plan_component(cls).values():
+            if impl_cls is not None:
+                visit(impl_cls)
+        visiting.pop()
+
+        visited.add(cls)
+        order.append(cls)
+
+    for cls in (roots if roots is not None else list(_component_registry)):
+        visit(cls)
+
+    _initialization_order[:] = order
+    return order
+
+def get_dependency_graph() -> Dict[str, List[str]]:
+    """
+    Return the planned dependency graph: component name -> names of its constructor dependencies.
+    Dependencies resolved from the service container (not components) are listed by type name.
+    """
+    graph = {}
+    for cls in _initialization_order or list(_component_registry):
+        graph[cls.__name__] = [
+            getattr(impl_cls or param_type, '__name__', str(param_type))
+            for impl_cls, param_type in _plan_component(cls).values()
+        ]
+    return graph
+
+def _register_instance(cls, instance, qualifier: Optional[str] = None):
     registry = get_registry()
     registry.register(cls, instance, qualifier)
 
@@ -145,8 +332,156 @@ def _initialize_component(cls):
             continue
         registry.register(base, instance, qualifier)
 
+def _get_lazy_proxy(cls) -> LazyComponentProxy:
+    proxy = _lazy_proxies.get(cls)
+    if proxy is None:
+        proxy = _lazy_proxies.setdefault(cls, LazyComponentProxy(cls))
+    return proxy
+
+def _get_request_proxy(cls) -> RequestScopedProxy:
+    proxy = _request_proxies.get(cls)
+    if proxy is None:
+        proxy = _request_proxies.setdefault(cls, RequestScopedProxy(cls))
+    return proxy
+
+def _get_request_instance(cls):
+    instances = _request_instances.get()
+    if instances is None:
+        raise RuntimeError(f"{cls.__name__} is request scoped but no request scope is active")
+
+    instance = instances.get(cls)
+    if instance is None:
+        instance = instances.setdefault(cls, _construct_component(cls))
+    return instance
+
+def _resolve_component(cls):
+    """
+    Return the built instance of a component (a new one for a prototype), or a proxy if it is request scoped,
+    or lazy and not built yet.
+    """
+    if cls in _initialized_components:
+        return _initialized_components[cls]
+    config = _component_registry.get(cls, {})
+    if config.get('scope') == Scope.REQUEST:
+        return _get_request_proxy(cls)
+    if config.get('scope') == Scope.PROTOTYPE:
+        # A new instance for every dependent, even if lazy: a lazy proxy would share the one it builds
+        return _initialize_component(cls)
+    if config.get('lazy'):
+        return _get_lazy_proxy(cls)
+    return _initialize_component(cls)
+
+def _processing_stack() -> Set[Type]:
+    # Per thread, so concurrent construction of the same class is not reported as a cycle
+    stack = getattr(_resolution_state, 'stack', None)
+    if stack is None:
+        stack = _resolution_state.stack = set()
+    return stack
+
+def _construct_component(cls):
+    """Build a new instance of a component from its resolution plan."""
+    processing_stack = _processing_stack()
+    if cls in processing_stack:
+        raise RuntimeError(f"Circular dependency detected while initializing {cls.__name__}")
+
+    processing_stack.add(cls)
+    try:
+        params = {}
+        for name, (impl_cls, param_type) in _plan_component(cls).items():
+            try:
+                if impl_cls:
+                    params[name] = _resolve_component(impl_cls)
+                else:
+                    # Try resolve from registry
+                    params[name] = get_registry().resolve(param_type)
+            except Exception as e:
+                raise ValueError(f"Failed to resolve dependency '{name}: {param_type}' for {cls.__name__}: {e}")
+
+        # Only startup constructions are reported, request scoped ones are built on every request
+        if not is_recording():
+            return cls(**params)
+        with timed(SECTION_COMPONENTS, cls.__name__):
+            return cls(**params)
+    finally:
+        processing_stack.discard(cls)
+
+def _initialize_component(cls):
+    if cls in _initialized_components:
+        return _initialized_components[cls]
+
+    config = _component_registry.get(cls, {'scope': Scope.SINGLETON})
+    scope = config.get('scope', Scope.SINGLETON)
+    qualifier = config.get('qualifier')
+
+    if scope == Scope.REQUEST:
+        # Request scoped components are only reachable through their proxy
+        proxy = _get_request_proxy(cls)
+        _register_instance(cls, proxy, qualifier)
+        return proxy
+
+    if scope != Scope.SINGLETON:
+        instance = _construct_component(cls)
+        _register_instance(cls, instance, qualifier)
+        return instance
+
+    with _singleton_lock(cls):
+        if cls in _initialized_components:
+            return _initialized_components[cls]
+        instance = _construct_component(cls)
+        _initialized_components[cls] = instance
+        # Register in the service container
+        _register_instance(cls, instance, qualifier)
     return instance
 
+def _singleton_lock(cls) -> threading.RLock:
+    # Reentrant: a circular dependency is reported by _construct_component instead of deadlocking
+    lock = _singleton_locks.get(cls)
+    if lock is None:
+        with _singleton_locks_lock:
+            lock = _singleton_locks.setdefault(cls, threading.RLock())
+    return lock
+
+def _compile_injector(cls, original_init):
+    """
+    Generate a specialized __init__ for an @inject class.
+    Signature and type hints are inspected and dependencies resolved from the container once;
+    the generated function only assigns them and calls the original __init__.
+    """
+    signature = inspect.signature(original_init)
+    type_hints = get_type_hints(original_init)
+    registry = get_registry()
+    names = []
+    namespace = {'__fastie_init': original_init}
+
+    for name, param in signature.parameters.items():
+        if name == 'self':
+            continue
+
+        param_type = type_hints.get(name)
+        if not param_type:
+            if param.default != inspect.Parameter.empty:
+                continue
+            raise ValueError(f"Missing type hint for parameter '{name}' in class {cls.__name__}")
+
+        try:
+            namespace[f'__fastie_dep_{len(names)}'] = registry.resolve(param_type)
+        except ValueError:
+            logger.error(f"Failed to inject {param_type.__name__} into {cls.__name__}")
+            raise
+        names.append(name)
+
+    lines = [
+        "def __init__(self, *args, **kwargs):",
+        "    if args or kwargs:",
+        "        __fastie_init(self, *args, **kwargs)",
+        "        return",
+    ]
+    lines.extend(f"    self.{name} = __fastie_dep_{i}" for i, name in enumerate(names))
+    lines.append("    __fastie_init(self, " + ", ".join(f"{name}=__fastie_dep_{i}" for i, name in enumerate(names)) + ")")
+
+    exec("\n".join(lines), namespace)
+    return wraps(original_init)(namespace['__init__'])
+
 def inject(cls=None):
     def decorator(cls):
         original_init = cls.__init__
@@ -157,30 +492,12 @@ def inject(cls=None):
                 original_init(self, *args, **kwargs)
                 return
 
-            signature = inspect.signature(original_init)
-            type_hints = get_type_hints(original_init)
-            injected_kwargs = {}
-
-            for name, param in signature.parameters.items():
-                if name == 'self':
-                    continue
-
-                param_type = type_hints.get(name)
-                if not param_type:
-                    if param.default != inspect.Parameter.empty:
-                        continue
-                    raise ValueError(f"Missing type hint for parameter '{name}' in class {cls.__name__}")
-
-                try:
-                    registry = get_registry()
-                    dependency = registry.resolve(param_type)
-                    injected_kwargs[name] = dependency
-                    setattr(self, name, dependency)
-                except ValueError:
-                    logger.error(f"Failed to inject {param_type.__name__} into {cls.__name__}")
-                    raise
-
-            original_init(self, **injected_kwargs)
+            # Compiled on first construction, once the dependencies are registered,
+            # then installed in place of this wrapper
+            compiled_init = _compile_injector(cls, original_init)
+            if cls.__init__ is new_init:
+                cls.__init__ = compiled_init
+            compiled_init(self)
 
         cls.__init__ = new_init
         return cls
@@ -189,7 +506,75 @@ def inject(cls=None):
         return decorator
     return decorator(cls)
 
-def load_components():
+def _initialize_in_parallel(components: List[Type], max_workers: Optional[int] = None):
+    """
+    Initialize eager components on a thread pool.
+    A component is submitted as soon as all of its eager dependencies are built,
+    so independent slow initializers (engine creation, settings loading...) overlap.
+    :param components: eager components in topological order
+    :param max_workers: thread pool size, defaults to the ThreadPoolExecutor default
+    """
+    component_set = set(components)
+    waiting_on = {cls: _eager_dependencies(cls, component_set) for cls in components}
+    dependents: Dict[Type, List[Type]] = {cls: [] for cls in components}
+    for cls, dependencies in waiting_on.items():
+        for dependency in dependencies:
+            dependents[dependency].append(cls)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fastie-init') as executor:
+        futures = {}
+
+        def submit(cls):
+            futures[executor.submit(_initialize_component, cls)] = cls
+
+        for cls in components:
+            if not waiting_on[cls]:
+                submit(cls)
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                cls = futures.pop(future)
+                future.result()  # Re-raise initialization errors
+                for dependent in dependents[cls]:
+                    waiting_on[dependent].discard(cls)
+                    if not waiting_on[dependent]:
+                        submit(dependent)
+
+def _eager_dependencies(cls, eager_components: Set[Type]) -> Set[Type]:
+    """
+    Eager components cls may build while it is constructed: its eager dependencies, and those reached
+    through lazy or request scoped dependencies (a constructor can use them, which builds them on the spot).
+    """
+    dependencies = set()
+    visited = {cls}
+    pending = [cls]
+    while pending:
+        for impl_cls, _ in _plan_component(pending.pop()).values():
+            if impl_cls is None or impl_cls in visited:
+                continue
+            visited.add(impl_cls)
+            if impl_cls in eager_components:
+                dependencies.add(impl_cls)
+            else:
+                pending.append(impl_cls)
+    return dependencies
+
+def _parallel_init_enabled() -> bool:
+    return os.getenv("FASTIE_PARALLEL_INIT", "false").lower() in ("1", "true", "yes")
+
+def load_components(parallel: Optional[bool] = None, max_workers: Optional[int] = None):
+    """
+    Plan and initialize the registered components.
+    :param parallel: initialize independent eager components concurrently, in dependency order.
+        Defaults to the FASTIE_PARALLEL_INIT environment variable (off).
+    :param max_workers: thread pool size in parallel mode, defaults to FASTIE_INIT_WORKERS
+    """
+    if parallel is None:
+        parallel = _parallel_init_enabled()
+    if max_workers is None and os.getenv("FASTIE_INIT_WORKERS"):
+        max_workers = int(os.getenv("FASTIE_INIT_WORKERS"))
+
     # Group components by type to avoid multiple iterations
     components_by_type = {
         'Infrastructure': [],
@@ -214,12 +599,172 @@ def load_components():
             components_by_type['Component'].append(cls)
 
     # Initialize in the correct order (Component has same priority as Infrastructure)
+    ordered_components = []
     for component_type in ['Infrastructure', 'Component', 'Repository', 'Service', 'Controller']:
-        for cls in components_by_type[component_type]:
-            if component_type in ['Infrastructure', 'Component'] and _component_registry[cls]['lazy']:
-                continue
+        ordered_components.extend(components_by_type[component_type])
+
+    # Dependencies are planned (and cycles detected) once, before anything is constructed
+    known_components = set(ordered_components)
+    eager_components = []
+    for cls in build_resolution_plan(ordered_components + list(_component_registry)):
+        if cls not in known_components:
+            continue
+        meta = _component_registry[cls]
+        if meta['scope'] == Scope.REQUEST:
+            # Built once per request, see request_scope()
+            _register_instance(cls, _get_request_proxy(cls), meta['qualifier'])
+        elif meta['lazy']:
+            # Registered as a proxy, built on first use
+            _register_instance(cls, _get_lazy_proxy(cls), meta['qualifier'])
+        else:
+            eager_components.append(cls)
+
+    if parallel:
+        _initialize_in_parallel(eager_components, max_workers)
+    else:
+        for cls in eager_components:
             _initialize_component(cls)
+    _eager_components.extend(eager_components)
 
+    report = get_component_report()
     print("Registered components:")
-    for cls in _component_registry:
-        print("-", cls.__name__)
+    for name in report['eager']:
+        print("-", name, "[eager]")
+    for name in report['materialized']:
+        print("-", name, "[lazy, materialized]")
+    for name in report['deferred']:
+        print("-", name, "[lazy, deferred]")
+
+def get_component_report() -> Dict[str, List[str]]:
+    """
+    Report which components are actually built.
+    :return: component names grouped as 'eager' (built at startup), 'materialized' (lazy, built since)
+        and 'deferred' (lazy, never used so far)
+    """
+    return {
+        'eager': [cls.__name__ for cls in _eager_components],
+        'materialized': [cls.__name__ for cls, proxy in _lazy_proxies.items() if proxy.is_materialized],
+        'deferred': [cls.__name__ for cls, proxy in _lazy_proxies.items() if not proxy.is_materialized],
+    }
+
+def _dispose_request_instances(instances: Dict[Type, Any]) -> Iterator[Tuple[Any, Awaitable]]:
+    """
+    Call close() on the request scoped instances defining it.
+    An async close() result is yielded with its instance: the caller awaits it before the next instance is closed.
+    """
+    # Dependents are created after their dependencies, so dispose in reverse order
+    for instance in reversed(list(instances.values())):
+        close = getattr(instance, 'close', None)
+        if not callable(close):
+            continue
+        try:
+            result = close()
+        except Exception as e:
+            logger.error(f"Failed to dispose {type(instance).__name__}: {e}")
+            continue
+        if inspect.isawaitable(result):
+            yield instance, result
+
+@contextmanager
+def request_scope():
+    """
+    Open a request scope: request scoped components resolved inside it are created once
+    and disposed (close() is called if they define it) when the scope exits.
+    Components with an async close() need async_request_scope().
+
+    Usage example:
+    with request_scope():
+        service.do_something()
+    """
+    token = _request_instances.set({})
+    try:
+        yield
+    finally:
+        instances = _request_instances.get()
+        _request_instances.reset(token)
+        for instance, result in _dispose_request_instances(instances):
+            logger.error(f"Cannot await the async close() of {type(instance).__name__} in request_scope(), use async_request_scope()")
+            if inspect.iscoroutine(result):
+                result.close()
+
+@asynccontextmanager
+async def async_request_scope():
+    """
+    request_scope() awaiting the async close() of the disposed components.
+
+    Usage example:
+    async with async_request_scope():
+        await service.do_something()
+    """
+    token = _request_instances.set({})
+    try:
+        yield
+    finally:
+        instances = _request_instances.get()
+        _request_instances.reset(token)
+        for instance, result in _dispose_request_instances(instances):
+            try:
+                await result
+            except Exception as e:
+                logger.error(f"Failed to dispose {type(instance).__name__}: {e}")
+
+async def request_scope_dependency():
+    """
+    FastAPI dependency opening a request scope for the current HTTP request.
+
+    Usage example:
+    app = FastAPI(dependencies=[Depends(request_scope_dependency)])
+    """
+    async with async_request_scope():
+        yield
+
+def _hook_timeout(timeout: Optional[float]) -> float:
+    if timeout is not None:
+        return timeout
+    return float(os.getenv("FASTIE_HOOK_TIMEOUT", DEFAULT_HOOK_TIMEOUT))
+
+async def _run_hook(cls, instance, hook_name: str, timeout: float):
+    hook = getattr(instance, hook_name, None)
+    if not callable(hook):
+        return
+
+    try:
+        if inspect.iscoroutinefunction(hook):
+            await asyncio.wait_for(hook(), timeout)
+        else:
+            # Sync hooks run in a worker thread so they don't block the event loop
+            await asyncio.wait_for(asyncio.to_thread(hook), timeout)
+    except asyncio.TimeoutError:
+        raise RuntimeError(f"{cls.__name__}.{hook_name} did not finish within {timeout}s")
+
+async def run_startup_hooks(timeout: Optional[float] = None):
+    """
+    Run the on_startup hook (sync or async) of every built component, dependencies first.
+    Lazy components that are not built yet are skipped.
+    :param timeout: per hook timeout in seconds, defaults to FASTIE_HOOK_TIMEOUT (30s)
+    """
+    timeout = _hook_timeout(timeout)
+    for cls in _initialization_order:
+        instance = _initialized_components.get(cls)
+        if instance is None or cls in _started_components:
+            continue
+        await _run_hook(cls, instance, 'on_startup', timeout)
+        _started_components.append(cls)
+        logger.info(f"{cls.__name__} started")
+
+async def run_shutdown_hooks(timeout: Optional[float] = None):
+    """
+    Run the on_shutdown hook (sync or async) of every built component, dependents first.
+    A failing or timed out hook is logged and does not prevent the others from running.
+    :param timeout: per hook timeout in seconds, defaults to FASTIE_HOOK_TIMEOUT (30s)
+    """
+    timeout = _hook_timeout(timeout)
+    for cls in reversed(_initialization_order):
+        instance = _initialized_components.get(cls)
+        if instance is None:
+            continue
+        try:
+            await _run_hook(cls, instance, 'on_shutdown', timeout)
+        except Exception as e:
+            logger.error(f"Failed to shut down {cls.__name__}: {e}")
+    _started_components.clear()
@@ -0,0 +1,12 @@
+from pathlib import Path
+
+
+def __cache_path__() -> Path:
+    """
+    Returns the path to the framework cache directory (component manifest, profiling reports...).
+    :return: Path object pointing to the cache directory.
+    """
+    # Need to go up 4 levels: paths -> core -> app -> root
+    base_dir = Path(__file__).resolve().parent.parent.parent.parent
+    cache_path = base_dir / "storage" / "cache"
+    return cache_path
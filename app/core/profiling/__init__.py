@@ -0,0 +1,3 @@
+from .startup_profiler import timed, record, get_timings, build_startup_report, is_recording, end_startup
+
+__all__ = ['timed', 'record', 'get_timings', 'build_startup_report', 'is_recording', 'end_startup']
@@ -0,0 +1,85 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# section -> name -> seconds
+_timings: Dict[str, Dict[str, float]] = {}
+
+SECTION_MODULES = "modules"
+SECTION_COMPONENTS = "components"
+SECTION_INFRASTRUCTURE = "infrastructure"
+
+# Startup in progress: set when this module is imported (first thing app.main does), cleared by
+# initialize_application(). Work done later (request scoped and lazy components) is not startup time.
+_recording = True
+
+
+def is_recording() -> bool:
+    return _recording
+
+
+def end_startup():
+    """
+    Stop recording: the startup report keeps the timings taken so far.
+    """
+    global _recording
+    _recording = False
+
+
+def record(section: str, name: str, seconds: float):
+    """
+    Record a startup timing.
+    :param section: Timing group (modules, components, infrastructure...)
+    :param name: What was timed (module name, component class name...)
+    :param seconds: Elapsed time in seconds
+    """
+    if not _recording:
+        return
+    _timings.setdefault(section, {})[name] = seconds
+
+
+@contextmanager
+def timed(section: str, name: str):
+    """
+    Time the wrapped block and record it under section/name.
+
+    Usage example:
+    with timed(SECTION_INFRASTRUCTURE, "DatabaseInfrastructure.create_engine"):
+        engine = create_engine(url)
+    """
+    if not _recording:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(section, name, time.perf_counter() - start)
+
+
+def get_timings(section: str) -> List[dict]:
+    """
+    Return the timings of a section, slowest first.
+    """
+    timings = _timings.get(section, {})
+    return [
+        {"name": name, "seconds": seconds}
+        for name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True)
+    ]
+
+
+def build_startup_report(total_seconds: Optional[float] = None) -> dict:
+    """
+    Build the startup report: module import times (inclusive of the modules they import first),
+    component construction times (exclusive of their dependencies), infrastructure timings
+    and the component dependency graph.
+    """
+    from app.core.decorators.di import get_dependency_graph
+
+    return {
+        "total_seconds": total_seconds,
+        SECTION_MODULES: get_timings(SECTION_MODULES),
+        SECTION_COMPONENTS: get_timings(SECTION_COMPONENTS),
+        SECTION_INFRASTRUCTURE: get_timings(SECTION_INFRASTRUCTURE),
+        "dependency_graph": get_dependency_graph(),
+    }
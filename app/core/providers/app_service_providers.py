@@ -1,8 +1,25 @@
+import ast
+import hashlib
 import importlib
+import json
 import os
 import pkgutil
+import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
-from app.core.decorators.di import load_components
+from typing import Dict, List, Optional
+
+from app.core.decorators.di import load_components, run_startup_hooks, run_shutdown_hooks
+from app.core.paths.cache import __cache_path__
+from app.core.profiling.startup_profiler import end_startup, timed, SECTION_MODULES
+
+MANIFEST_VERSION = 1
+
+# Decorators of app.core.decorators.di that register a class in the container
+COMPONENT_DECORATORS = {
+    'component', 'component_decorator', 'component_eager', 'infrastructure',
+    'service', 'repository', 'controller',
+}
 
 def discover_components():
     """
@@ -23,7 +40,9 @@ def discover_components():
             for _, name, is_pkg in pkgutil.iter_modules([package_dir]):
                 full_name = f"{package_name}.{name}"
                 try:
-                    importlib.import_module(full_name)
+                    if full_name not in sys.modules:
+                        with timed(SECTION_MODULES, full_name):
+                            importlib.import_module(full_name)
                     if is_pkg:
                         scan_package(full_name)
                 except Exception as e:
@@ -48,13 +67,143 @@ def discover_submodules(package_name):
         except Exception as e:
             print(f"Error importing {full_name}: {e}")
 
+def _app_package_dir() -> Path:
+    return Path(importlib.import_module("app").__file__).resolve().parent
+
+def _module_name(package_dir: Path, file_path: Path) -> str:
+    relative = file_path.relative_to(package_dir.parent).with_suffix("")
+    parts = list(relative.parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+def _file_digest(file_path: Path) -> str:
+    return hashlib.sha1(file_path.read_bytes()).hexdigest()
+
+def _source_files(package_dir: Path) -> List[Path]:
+    return sorted(p for p in package_dir.rglob("*.py") if "__pycache__" not in p.parts)
+
+def _defines_component(tree: ast.AST) -> bool:
+    """Check whether a parsed module declares a class decorated with a DI component decorator."""
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for decorator in node.decorator_list:
+            target = decorator.func if isinstance(decorator, ast.Call) else decorator
+            name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", None)
+            if name in COMPONENT_DECORATORS:
+                return True
+    return False
+
+def component_manifest_path() -> Path:
+    return __cache_path__() / "components.json"
+
+def build_component_manifest(path: Optional[Path] = None) -> dict:
+    """
+    Statically scan the app package and write the component manifest.
+    Nothing is imported, so building the manifest has no side effects.
+    :param path: Optional target file, defaults to storage/cache/components.json
+    :return: The manifest that was written.
+    """
+    package_dir = _app_package_dir()
+    files: Dict[str, dict] = {}
+    modules: List[str] = []
+
+    for file_path in _source_files(package_dir):
+        source = file_path.read_bytes()
+        stat = file_path.stat()
+        relative = file_path.relative_to(package_dir).as_posix()
+        files[relative] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha1": hashlib.sha1(source).hexdigest(),
+        }
+        try:
+            tree = ast.parse(source, filename=str(file_path))
+        except SyntaxError as e:
+            print(f"Error parsing {file_path}: {e}")
+            continue
+        if _defines_component(tree):
+            modules.append(_module_name(package_dir, file_path))
+
+    manifest = {"version": MANIFEST_VERSION, "modules": modules, "files": files}
+
+    path = Path(path) if path else component_manifest_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+def load_component_manifest(path: Optional[Path] = None) -> Optional[List[str]]:
+    """
+    Read the component manifest and check it against the current sources.
+    A file is considered unchanged when its mtime and size match; otherwise its hash is compared.
+    :param path: Optional manifest file, defaults to storage/cache/components.json
+    :return: The component modules to import, or None when the manifest is missing or stale.
+    """
+    path = Path(path) if path else component_manifest_path()
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+
+    package_dir = _app_package_dir()
+    recorded = manifest.get("files", {})
+    current = _source_files(package_dir)
+    if len(current) != len(recorded):
+        return None
+
+    for file_path in current:
+        entry = recorded.get(file_path.relative_to(package_dir).as_posix())
+        if entry is None:
+            return None
+        stat = file_path.stat()
+        if stat.st_mtime_ns == entry["mtime_ns"] and stat.st_size == entry["size"]:
+            continue
+        if _file_digest(file_path) != entry["sha1"]:
+            return None
+
+    return manifest.get("modules", [])
+
+def import_component_modules(modules: List[str]) -> bool:
+    """
+    Import only the modules listed in the component manifest.
+    :return: True if every module was imported, False otherwise.
+    """
+    for module_name in modules:
+        try:
+            if module_name not in sys.modules:
+                with timed(SECTION_MODULES, module_name):
+                    importlib.import_module(module_name)
+        except Exception as e:
+            print(f"Error importing {module_name}: {e}")
+            return False
+    return True
+
 def initialize_application():
     """Initialize the application components."""
-    # Discover and import all component classes
-    discover_components()
+    # Import component modules from the manifest, fall back to a full scan when it is stale
+    modules = load_component_manifest()
+    if modules is None or not import_component_modules(modules):
+        discover_components()
 
     # Initialize all non-lazy components
     load_components()
+    end_startup()
 
     # Any additional application-specific initialization
-    # that can't be handled by decorators
\ No newline at end of file
+    # that can't be handled by decorators
+
+@asynccontextmanager
+async def application_lifespan(app):
+    """
+    FastAPI lifespan handler: runs the components' on_startup hooks before the application
+    accepts traffic and their on_shutdown hooks, in reverse order, when it stops.
+    """
+    await run_startup_hooks()
+    try:
+        yield
+    finally:
+        await run_shutdown_hooks()
@@ -0,0 +1,244 @@
+import gc
+import importlib
+import importlib.util
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Dict, List, Optional
+
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+
+def _import_app(app_path: str):
+    module_name, _, attribute = app_path.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute or "app")
+
+
+def best_event_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def best_http_protocol() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+class PreforkServer:
+    """
+    Multi-worker server that preloads the application once in the master process.
+
+    The application (and its component graph) is imported and initialized before forking,
+    then moved to the permanent GC generation with gc.freeze() so the workers share it
+    copy-on-write instead of re-importing and rebuilding it.
+
+    Signals handled by the master:
+    - SIGTERM / SIGINT: graceful shutdown of every worker
+    - SIGHUP: rolling restart, one worker at a time
+    Workers that die unexpectedly are restarted. A worker dying within boot_timeout seconds of its start
+    (bad configuration, import error...) is restarted with an exponential backoff; after max_boot_failures
+    such deaths in a row the master stops and run() returns a non-zero exit code.
+    """
+
+    def __init__(
+            self,
+            app_path: str = "app.main:app",
+            host: str = "0.0.0.0",
+            port: int = 8000,
+            workers: int = 2,
+            graceful_timeout: float = 30,
+            backlog: int = 2048,
+            boot_timeout: float = 10,
+            max_boot_failures: int = 5,
+            respawn_backoff: float = 1,
+            max_respawn_backoff: float = 30,
+    ):
+        """
+        :param boot_timeout: a worker exiting within this many seconds of its start failed to boot
+        :param max_boot_failures: consecutive boot failures (any worker) before giving up
+        :param respawn_backoff: delay before restarting a worker after the first boot failure, doubled at each next one
+        :param max_respawn_backoff: maximum delay before restarting a worker
+        """
+        self.app_path = app_path
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.backlog = backlog
+        self.boot_timeout = boot_timeout
+        self.max_boot_failures = max_boot_failures
+        self.respawn_backoff = respawn_backoff
+        self.max_respawn_backoff = max_respawn_backoff
+        self.loop = best_event_loop()
+        self.http = best_http_protocol()
+
+        self._app = None
+        self._socket: Optional[socket.socket] = None
+        self._worker_pids: Dict[int, float] = {}
+        self._stopping = False
+        self._restart_requested = False
+        # Times at which a dead worker is replaced
+        self._pending_respawns: List[float] = []
+        self._boot_failures = 0
+        self._exit_code = 0
+
+    def run(self) -> int:
+        """
+        :return: process exit code, non-zero if the workers kept failing to boot
+        """
+        # Preload: build the application and its components once, in the master
+        self._app = _import_app(self.app_path)
+        gc.collect()
+        gc.freeze()
+
+        self._socket = self._bind()
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGHUP, self._handle_restart)
+
+        logger.info(f"Master {os.getpid()} listening on {self.host}:{self.port} "
+                    f"({self.workers} workers, loop={self.loop}, http={self.http})")
+
+        for _ in range(self.workers):
+            self._spawn_worker()
+
+        try:
+            while not self._stopping:
+                if self._restart_requested:
+                    self._restart_requested = False
+                    self._rolling_restart()
+                self._reap_workers(respawn=True)
+                self._spawn_pending_workers()
+                time.sleep(0.5)
+        finally:
+            self._stop_workers()
+            self._socket.close()
+        return self._exit_code
+
+    def _bind(self) -> socket.socket:
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(self.backlog)
+        sock.set_inheritable(True)
+        return sock
+
+    def _spawn_worker(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            # Worker: uvicorn installs its own SIGTERM/SIGINT handlers for graceful shutdown
+            for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+                signal.signal(signum, signal.SIG_DFL)
+            exit_code = 0
+            try:
+                config = uvicorn.Config(
+                    self._app,
+                    loop=self.loop,
+                    http=self.http,
+                    lifespan="on",
+                    timeout_graceful_shutdown=int(self.graceful_timeout),
+                )
+                uvicorn.Server(config).run(sockets=[self._socket])
+            except Exception:
+                logger.exception(f"Worker {os.getpid()} crashed")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        self._worker_pids[pid] = time.time()
+        logger.info(f"Booted worker {pid}")
+        return pid
+
+    def _reap_workers(self, respawn: bool):
+        while self._worker_pids:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._worker_pids.clear()
+                return
+            if pid == 0:
+                return
+            started_at = self._worker_pids.pop(pid, None)
+            if started_at is not None and respawn and not self._stopping:
+                self._schedule_respawn(pid, status, time.time() - started_at)
+
+    def _schedule_respawn(self, pid: int, status: int, lifetime: float):
+        if lifetime >= self.boot_timeout:
+            self._boot_failures = 0
+            logger.warning(f"Worker {pid} exited with status {status}, restarting")
+            self._pending_respawns.append(time.time())
+            return
+
+        self._boot_failures += 1
+        if self._boot_failures >= self.max_boot_failures:
+            logger.error(f"Worker {pid} exited with status {status} {lifetime:.1f}s after its start, "
+                         f"{self._boot_failures} boot failures in a row: stopping")
+            self._exit_code = 1
+            self._stopping = True
+            return
+
+        delay = min(self.respawn_backoff * 2 ** (self._boot_failures - 1), self.max_respawn_backoff)
+        logger.warning(f"Worker {pid} exited with status {status} {lifetime:.1f}s after its start, "
+                       f"restarting in {delay:.1f}s")
+        self._pending_respawns.append(time.time() + delay)
+
+    def _spawn_pending_workers(self):
+        now = time.time()
+        due = [at for at in self._pending_respawns if at <= now]
+        self._pending_respawns = [at for at in self._pending_respawns if at > now]
+        for _ in due:
+            self._spawn_worker()
+
+    def _wait_worker(self, pid: int, timeout: float) -> bool:
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                finished, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                return True
+            if finished == pid:
+                return True
+            time.sleep(0.1)
+        return False
+
+    def _terminate_worker(self, pid: int, send_signal: bool = True):
+        # A second SIGTERM makes uvicorn exit without draining, so it is only sent once
+        if send_signal:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        if not self._wait_worker(pid, self.graceful_timeout):
+            logger.warning(f"Worker {pid} did not stop within {self.graceful_timeout}s, killing it")
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            self._wait_worker(pid, 5)
+        self._worker_pids.pop(pid, None)
+
+    def _rolling_restart(self):
+        logger.info("Rolling restart of workers")
+        for pid in list(self._worker_pids):
+            # Start the replacement first so capacity never drops
+            self._spawn_worker()
+            self._terminate_worker(pid)
+
+    def _stop_workers(self):
+        for pid in list(self._worker_pids):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in list(self._worker_pids):
+            self._terminate_worker(pid, send_signal=False)
+
+    def _handle_stop(self, signum, frame):
+        self._stopping = True
+
+    def _handle_restart(self, signum, frame):
+        self._restart_requested = True
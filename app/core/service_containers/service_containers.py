@@ -1,24 +1,53 @@
+import threading
 from typing import Type, Dict, Any, Optional, Tuple
 
 _registry_instance = None
+_registry_lock = threading.Lock()
 
 def get_registry():
     global _registry_instance
     if _registry_instance is None:
-        _registry_instance = ServiceContainers()
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = ServiceContainers()
     return _registry_instance
 
 class ServiceContainers:
+    """
+    Service container.
+    Registrations are serialized by a lock and publish a new copy of the services dict,
+    so resolve() reads an immutable snapshot without locking: a single dict lookup.
+    Once sealed (after startup), only existing registrations can be replaced
+    (e.g. a lazy proxy by its built instance).
+    """
     def __init__(self):
         if not hasattr(self, '_services'):
             self._services: Dict[Tuple[Type, Optional[str]], Any] = {}
+        self._lock = threading.Lock()
+        self._sealed = False
 
     def register(self, service_type: Type, instance: Any, qualifier: Optional[str] = None):
         key = (service_type, qualifier)
-        self._services[key] = instance
+        with self._lock:
+            if self._sealed and key not in self._services:
+                raise RuntimeError(f"Service container is sealed, cannot register {service_type} with qualifier={qualifier}")
+            services = dict(self._services)
+            services[key] = instance
+            self._services = services
 
     def resolve(self, service_type: Type, qualifier: Optional[str] = None) -> Any:
-        key = (service_type, qualifier)
-        if key not in self._services:
-            raise ValueError(f"Service not found for {service_type} with qualifier={qualifier}")
-        return self._services[key]
\ No newline at end of file
+        try:
+            return self._services[(service_type, qualifier)]
+        except KeyError:
+            raise ValueError(f"Service not found for {service_type} with qualifier={qualifier}") from None
+
+    def seal(self):
+        """
+        Reject new registrations. Called once the application is fully initialized.
+        """
+        with self._lock:
+            self._sealed = True
+
+    @property
+    def sealed(self) -> bool:
+        return self._sealed
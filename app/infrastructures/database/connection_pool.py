@@ -0,0 +1,152 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+POOL_CLASSES = {
+    "queue": QueuePool,
+    "null": NullPool,
+}
+
+ASYNC_POOL_CLASSES = {
+    "queue": AsyncAdaptedQueuePool,
+    "null": NullPool,
+}
+
+PRE_PING_STRATEGIES = ("pessimistic", "optimistic")
+
+# Upper bounds (milliseconds) of the checkout wait time histogram buckets
+WAIT_TIME_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+class PoolMetrics:
+    """
+    Live counters of one connection pool, fed by the instrumented pool class and pool events.
+    """
+    def __init__(self, pool_class: str):
+        self.pool_class = pool_class
+        self._lock = threading.Lock()
+        self._checked_out = 0
+        self._checkouts = 0
+        self._connects = 0
+        self._connect_failures = 0
+        self._timeouts = 0
+        self._invalidated = 0
+        self._wait_buckets = [0] * (len(WAIT_TIME_BUCKETS_MS) + 1)
+        self._wait_count = 0
+        self._wait_sum_ms = 0.0
+        self._wait_max_ms = 0.0
+        self._engine = None
+
+    def attach(self, engine):
+        """
+        Listen to the pool events of an engine.
+        :param engine: Engine (or AsyncEngine.sync_engine) created with an instrumented pool class
+        """
+        # The engine, not its pool: engine.dispose() (e.g. in a forked worker) replaces the pool
+        self._engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    @property
+    def checked_out(self) -> int:
+        """
+        Connections currently in use.
+        """
+        return self._checked_out
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self._connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self._checked_out += 1
+            self._checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self._checked_out = max(self._checked_out - 1, 0)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self._invalidated += 1
+
+    def record_wait(self, seconds: float, error: Optional[BaseException] = None):
+        """
+        Record how long a checkout waited for a connection, and whether it failed.
+        """
+        elapsed_ms = seconds * 1000.0
+        index = len(WAIT_TIME_BUCKETS_MS)
+        for i, bound in enumerate(WAIT_TIME_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self._wait_buckets[index] += 1
+            self._wait_count += 1
+            self._wait_sum_ms += elapsed_ms
+            if elapsed_ms > self._wait_max_ms:
+                self._wait_max_ms = elapsed_ms
+            if isinstance(error, exc.TimeoutError):
+                self._timeouts += 1
+            elif error is not None:
+                self._connect_failures += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        :return: a point-in-time copy of the pool metrics
+        """
+        pool = self._engine.pool if self._engine is not None else None
+        with self._lock:
+            buckets = {f"le_{bound}": count for bound, count in zip(WAIT_TIME_BUCKETS_MS, self._wait_buckets)}
+            buckets["le_inf"] = self._wait_buckets[-1]
+            data = {
+                "pool_class": self.pool_class,
+                "checked_out": self._checked_out,
+                "checkouts": self._checkouts,
+                "connects": self._connects,
+                "connect_failures": self._connect_failures,
+                "timeouts": self._timeouts,
+                "invalidated": self._invalidated,
+                "wait_time_ms": {
+                    "count": self._wait_count,
+                    "sum": round(self._wait_sum_ms, 3),
+                    "max": round(self._wait_max_ms, 3),
+                    "buckets": buckets,
+                },
+            }
+        if isinstance(pool, QueuePool):
+            data["size"] = pool.size()
+            data["checked_in"] = pool.checkedin()
+            # overflow() is negative while the pool has not yet opened pool_size connections
+            data["overflow"] = max(pool.overflow(), 0)
+            data["max_overflow"] = pool._max_overflow
+        else:
+            data["size"] = None
+            data["checked_in"] = 0
+            data["overflow"] = 0
+            data["max_overflow"] = None
+        return data
+
+def instrumented_pool_class(base, metrics: PoolMetrics):
+    """
+    Subclass a pool class so that every checkout is timed and failures are counted.
+    The metrics live on the class: Pool.recreate() (used by engine.dispose()) keeps them.
+    :param base: QueuePool, AsyncAdaptedQueuePool or NullPool
+    :param metrics: PoolMetrics receiving the measurements
+    """
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = base._do_get(self)
+        except BaseException as e:
+            metrics.record_wait(time.perf_counter() - start, e)
+            raise
+        metrics.record_wait(time.perf_counter() - start)
+        return record
+
+    return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get, "metrics": metrics})
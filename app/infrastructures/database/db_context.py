@@ -1,23 +1,154 @@
+from contextlib import contextmanager
+
 from app.core.decorators.di import inject
 from app.core.service_containers.service_containers import get_registry
 from app.infrastructures.database.database_infrastructure import DatabaseInfrastructure
+from app.infrastructures.database.session_context import (
+    bind_session, unbind_session, bind_async_session, unbind_async_session
+)
+from app.infrastructures.database.unit_of_work import current_unit_of_work
 
 registry = get_registry()
 
 @inject
 class DbContext:
+    """
+    Session for one service call, committed on exit.
+    Inside a unit of work, the unit of work's session is used instead and committed when it completes.
+    The session is bound to the current context while the block runs: repositories read it from there.
+    """
     def __init__(self, database: DatabaseInfrastructure):
         self.database = database
         self.session = None
+        self.unit_of_work = None
+        self._token = None
+
+    # False for contexts that must own their session even inside a unit of work
+    use_unit_of_work = True
+    # False for contexts held across the yields of a generator: see bound()
+    bind_to_context = True
 
     def __enter__(self):
-        self.session = self.database.get_session()
+        self.unit_of_work = current_unit_of_work() if self.use_unit_of_work else None
+        if self.unit_of_work is not None:
+            self.session = self.unit_of_work.get_session()
+        else:
+            self.session = self.database.get_session()
+        if self.bind_to_context:
+            self._token = bind_session(self.session)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
+        if self._token is not None:
+            unbind_session(self._token)
+        if self.unit_of_work is not None:
+            # A failure inside a savepoint is rolled back by the savepoint itself
+            if exc_type and not self.unit_of_work.in_savepoint:
+                self.unit_of_work.mark_failed()
+            return
+
         if exc_type:
             self.session.rollback()
         else:
             self.session.commit()
         self.session.close()
 
+    @contextmanager
+    def bound(self):
+        """
+        Bind the session to the current context for the duration of the block only.
+        """
+        token = bind_session(self.session)
+        try:
+            yield self.session
+        finally:
+            unbind_session(token)
+
+@inject
+class StandaloneDbContext(DbContext):
+    """
+    DbContext with its own session even inside a unit of work,
+    for work that outlives the request transaction such as a streamed response.
+    """
+    use_unit_of_work = False
+
+    def __init__(self, database: DatabaseInfrastructure):
+        super().__init__(database)
+
+@inject
+class StreamingDbContext(StandaloneDbContext):
+    """
+    StandaloneDbContext for a generator. A StreamingResponse resumes the generator in a new copy of the request
+    context at every step, so a binding set in one step is not there in the next: the session is not bound
+    on enter, wrap each step in bound() instead.
+    """
+    bind_to_context = False
+
+    def __init__(self, database: DatabaseInfrastructure):
+        super().__init__(database)
+
+@inject
+class AsyncDbContext:
+    """
+    Async counterpart of DbContext.
+    """
+    def __init__(self, database: DatabaseInfrastructure):
+        self.database = database
+        self.session = None
+        self.unit_of_work = None
+        self._token = None
+
+    use_unit_of_work = True
+    bind_to_context = True
+
+    async def __aenter__(self):
+        self.unit_of_work = current_unit_of_work() if self.use_unit_of_work else None
+        if self.unit_of_work is not None:
+            self.session = self.unit_of_work.get_async_session()
+        else:
+            self.session = self.database.get_async_session()
+        if self.bind_to_context:
+            self._token = bind_async_session(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._token is not None:
+            unbind_async_session(self._token)
+        if self.unit_of_work is not None:
+            if exc_type and not self.unit_of_work.in_savepoint:
+                self.unit_of_work.mark_failed()
+            return
+
+        if exc_type:
+            await self.session.rollback()
+        else:
+            await self.session.commit()
+        await self.session.close()
+
+    @contextmanager
+    def bound(self):
+        token = bind_async_session(self.session)
+        try:
+            yield self.session
+        finally:
+            unbind_async_session(token)
+
+@inject
+class StandaloneAsyncDbContext(AsyncDbContext):
+    """
+    Async counterpart of StandaloneDbContext.
+    """
+    use_unit_of_work = False
+
+    def __init__(self, database: DatabaseInfrastructure):
+        super().__init__(database)
+
+@inject
+class StreamingAsyncDbContext(StandaloneAsyncDbContext):
+    """
+    Async counterpart of StreamingDbContext.
+    """
+    bind_to_context = False
+
+    def __init__(self, database: DatabaseInfrastructure):
+        super().__init__(database)
@@ -0,0 +1,181 @@
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.util import find_tables
+
+from app.infrastructures.database.connection_pool import PoolMetrics
+
+BALANCING_STRATEGIES = ("round_robin", "least_connections")
+
+# Set by use_primary(): every read of the current thread / task goes to the primary
+_primary_pinned: ContextVar[bool] = ContextVar('fastie_db_primary_pinned', default=False)
+
+@contextmanager
+def use_primary():
+    """
+    Send the reads of the block to the primary, e.g. right after a write made by another request of the same user.
+
+    Usage example:
+    with use_primary():
+        user = user_service.get_by_id(user_id)
+    """
+    token = _primary_pinned.set(True)
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+def _statement_tables(clause) -> Tuple[str, ...]:
+    return tuple({table.name for table in find_tables(clause, include_aliases=True) if hasattr(table, 'name')})
+
+def _mapper_tables(mapper) -> Tuple[str, ...]:
+    info = inspect(mapper, raiseerr=False)
+    tables = getattr(info, 'tables', None)
+    if tables is None:
+        return ()
+    return tuple(table.name for table in tables if hasattr(table, 'name'))
+
+class ReplicaRouter:
+    """
+    Primary engine plus read replicas.
+    Reads are balanced over the replicas, writes go to the primary. A table written through this process
+    is read from the primary during read_your_writes_window seconds after the commit, the time replicas need to catch up.
+    """
+    def __init__(
+            self,
+            primary,
+            replicas: List[Tuple[Any, PoolMetrics]],
+            balancing: str = "round_robin",
+            read_your_writes_window: float = 2.0,
+    ):
+        """
+        :param primary: Engine receiving writes (the sync_engine of an AsyncEngine for async sessions)
+        :param replicas: (engine, pool metrics) of every replica
+        :param balancing: round_robin, or least_connections (fewest checked out connections)
+        :param read_your_writes_window: seconds reads of a written table stay on the primary, 0 to disable
+        """
+        if balancing not in BALANCING_STRATEGIES:
+            raise ValueError(f"Replica balancing must be one of {', '.join(BALANCING_STRATEGIES)}")
+        if not replicas:
+            raise ValueError("ReplicaRouter needs at least one replica")
+        self.primary = primary
+        self.replicas = [engine for engine, _ in replicas]
+        self._replica_metrics = [metrics for _, metrics in replicas]
+        self.balancing = balancing
+        self.read_your_writes_window = read_your_writes_window
+        self._counter = itertools.count()
+        self._written_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._replica_reads = [0] * len(self.replicas)
+        self._primary_reads = 0
+
+    def choose_replica(self) -> int:
+        """
+        :return: index of the replica serving the next read transaction
+        """
+        start = next(self._counter) % len(self.replicas)
+        if self.balancing == "round_robin":
+            return start
+        # Scan from a rotating start so that idle replicas share the load
+        order = [(start + i) % len(self.replicas) for i in range(len(self.replicas))]
+        return min(order, key=lambda index: self._replica_metrics[index].checked_out)
+
+    def record_writes(self, tables: Iterable[str]):
+        """
+        Start the read-your-writes window of committed tables.
+        """
+        if self.read_your_writes_window <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            for table in tables:
+                self._written_at[table] = now
+
+    def recently_written(self, tables: Iterable[str]) -> bool:
+        if self.read_your_writes_window <= 0 or not self._written_at:
+            return False
+        horizon = time.monotonic() - self.read_your_writes_window
+        return any(self._written_at.get(table, 0.0) > horizon for table in tables)
+
+    def record_read(self, replica: Optional[int]):
+        with self._lock:
+            if replica is None:
+                self._primary_reads += 1
+            else:
+                self._replica_reads[replica] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "balancing": self.balancing,
+                "read_your_writes_window": self.read_your_writes_window,
+                "primary_reads": self._primary_reads,
+                "replica_reads": list(self._replica_reads),
+                "replica_checked_out": [metrics.checked_out for metrics in self._replica_metrics],
+            }
+
+class RoutingSession(Session):
+    """
+    Session choosing the engine of every statement:
+    - flushes, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE and textual statements go to the primary;
+    - once the transaction has written, all its reads go to the primary (it must see its own changes);
+    - reads of a table committed less than read_your_writes_window seconds ago, or inside use_primary(), go to the primary;
+    - other reads go to one replica, kept until the end of the transaction.
+    """
+    def __init__(self, *args, router: Optional[ReplicaRouter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self._replica: Optional[int] = None
+        self._written_tables: set = set()
+        self._wrote = False
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        router = self.router
+        if router is None:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        if self._flushing or getattr(clause, 'is_dml', False):
+            self._wrote = True
+            tables = _mapper_tables(mapper) if mapper is not None else ()
+            if not tables and getattr(clause, 'table', None) is not None:
+                tables = _statement_tables(clause.table)
+            self._written_tables.update(tables)
+            return router.primary
+
+        if clause is None:
+            # No statement to route (e.g. get_bind().dialect, connection()): not counted as a read
+            return router.primary
+
+        if (
+                self._wrote
+                or not getattr(clause, 'is_select', False)
+                or getattr(clause, '_for_update_arg', None) is not None
+                or _primary_pinned.get()
+                or router.recently_written(_statement_tables(clause))
+        ):
+            router.record_read(None)
+            return router.primary
+
+        if self._replica is None:
+            self._replica = router.choose_replica()
+        router.record_read(self._replica)
+        return router.replicas[self._replica]
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _after_commit(session):
+    if session.router is not None and session._written_tables:
+        session.router.record_writes(session._written_tables)
+
+@event.listens_for(RoutingSession, 'after_transaction_end')
+def _after_transaction_end(session, transaction):
+    # A new transaction may pick another replica, and reads until its first write
+    if transaction.parent is None:
+        session._replica = None
+        session._written_tables = set()
+        session._wrote = False
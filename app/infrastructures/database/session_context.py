@@ -0,0 +1,32 @@
+from contextvars import ContextVar, Token
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Session of the innermost DbContext / AsyncDbContext of the current thread or task.
+# Repositories are singletons: they read their session from here instead of storing it on the instance.
+_current_session: ContextVar[Optional[Session]] = ContextVar('fastie_db_session', default=None)
+_current_async_session: ContextVar[Optional[AsyncSession]] = ContextVar('fastie_db_async_session', default=None)
+
+def current_session() -> Optional[Session]:
+    return _current_session.get()
+
+def bind_session(session: Optional[Session]) -> Token:
+    """
+    Bind a session to the current context.
+    :return: token to pass to unbind_session() to restore the previous binding
+    """
+    return _current_session.set(session)
+
+def unbind_session(token: Token):
+    _current_session.reset(token)
+
+def current_async_session() -> Optional[AsyncSession]:
+    return _current_async_session.get()
+
+def bind_async_session(session: Optional[AsyncSession]) -> Token:
+    return _current_async_session.set(session)
+
+def unbind_async_session(token: Token):
+    _current_async_session.reset(token)
@@ -0,0 +1,192 @@
+import logging
+import os
+from contextlib import contextmanager, asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.decorators.di import inject
+from app.infrastructures.database.database_infrastructure import DatabaseInfrastructure
+
+logger = logging.getLogger(__name__)
+
+# Unit of work bound to the current HTTP request (or unit_of_work() block)
+_current_unit_of_work: ContextVar[Optional['UnitOfWork']] = ContextVar('fastie_unit_of_work', default=None)
+
+def current_unit_of_work() -> Optional['UnitOfWork']:
+    """
+    :return: the active unit of work, or None outside of one
+    """
+    return _current_unit_of_work.get()
+
+def unit_of_work_enabled() -> bool:
+    return os.getenv("FASTIE_UNIT_OF_WORK", "false").lower() in ("1", "true", "yes")
+
+@inject
+class UnitOfWork:
+    """
+    One session/transaction shared by every DbContext (and AsyncDbContext) opened while it is active,
+    committed once when the unit of work completes.
+    Sessions are opened on first use, so a request that never touches the database checks out no connection.
+    A failure inside a DbContext marks the unit of work as failed and it rolls back instead of committing,
+    unless the failure happened inside a savepoint(), which only rolls back to that savepoint.
+    """
+    def __init__(self, database: DatabaseInfrastructure):
+        self.database = database
+        self.session = None
+        self.async_session = None
+        self.failed = False
+        self._savepoint_depth = 0
+        # False when completed by complete(), which cannot await the async session
+        self.allow_async = True
+
+    def get_session(self):
+        if self.session is None:
+            self.session = self.database.get_session()
+        return self.session
+
+    def get_async_session(self):
+        if not self.allow_async:
+            raise RuntimeError("An AsyncDbContext cannot join unit_of_work(), use async_unit_of_work()")
+        if self.async_session is None:
+            self.async_session = self.database.get_async_session()
+        return self.async_session
+
+    @property
+    def in_savepoint(self) -> bool:
+        return self._savepoint_depth > 0
+
+    def mark_failed(self):
+        """
+        Roll back instead of committing when the unit of work completes.
+        """
+        self.failed = True
+
+    @contextmanager
+    def savepoint(self):
+        """
+        Run a block in a nested transaction (SAVEPOINT): an exception leaving the block rolls back
+        only the work done inside it, and the rest of the unit of work can still be committed.
+
+        Usage example:
+        with current_unit_of_work().savepoint():
+            audit_service.create(entry)
+        """
+        self._savepoint_depth += 1
+        try:
+            with self.get_session().begin_nested():
+                yield self.session
+        finally:
+            self._savepoint_depth -= 1
+
+    @asynccontextmanager
+    async def async_savepoint(self):
+        """
+        Async counterpart of savepoint(), on the async session.
+        """
+        self._savepoint_depth += 1
+        try:
+            async with self.get_async_session().begin_nested():
+                yield self.async_session
+        finally:
+            self._savepoint_depth -= 1
+
+    def _complete_session(self, commit: bool):
+        if self.session is None:
+            return
+        try:
+            if commit:
+                self.session.commit()
+            else:
+                self.session.rollback()
+        finally:
+            self.session.close()
+
+    async def _complete_async_session(self, commit: bool):
+        if self.async_session is None:
+            return
+        try:
+            if commit:
+                await self.async_session.commit()
+            else:
+                await self.async_session.rollback()
+        finally:
+            await self.async_session.close()
+
+    def complete(self, exc: Optional[BaseException] = None):
+        """
+        Commit (or roll back on failure) and close the sync session.
+        """
+        self._complete_session(exc is None and not self.failed)
+
+    async def complete_async(self, exc: Optional[BaseException] = None):
+        """
+        Commit (or roll back on failure) and close both sessions without blocking the event loop.
+        """
+        commit = exc is None and not self.failed
+        try:
+            await self._complete_async_session(commit)
+        finally:
+            if self.session is not None:
+                await run_in_threadpool(self._complete_session, commit)
+
+@contextmanager
+def unit_of_work():
+    """
+    Share one session/transaction between every DbContext opened in the block, committed once at the end.
+    Async services (AsyncDbContext) need async_unit_of_work().
+
+    Usage example:
+    with unit_of_work():
+        user_service.create(user)
+        profile_service.create(profile)
+    """
+    uow = UnitOfWork()
+    uow.allow_async = False
+    token = _current_unit_of_work.set(uow)
+    try:
+        yield uow
+    except BaseException as e:
+        _current_unit_of_work.reset(token)
+        uow.complete(e)
+        raise
+    _current_unit_of_work.reset(token)
+    uow.complete()
+
+@asynccontextmanager
+async def async_unit_of_work():
+    """
+    unit_of_work() for async code: DbContext and AsyncDbContext opened in the block share its sessions,
+    both committed at the end.
+
+    Usage example:
+    async with async_unit_of_work():
+        await user_service.create(user)
+        await profile_service.create(profile)
+    """
+    uow = UnitOfWork()
+    token = _current_unit_of_work.set(uow)
+    try:
+        yield uow
+    except BaseException as e:
+        _current_unit_of_work.reset(token)
+        await uow.complete_async(e)
+        raise
+    _current_unit_of_work.reset(token)
+    await uow.complete_async()
+
+async def unit_of_work_dependency():
+    """
+    FastAPI dependency binding a unit of work to the current HTTP request when FASTIE_UNIT_OF_WORK is enabled.
+    Declare it with scope="function" so the transaction is committed before the response is sent.
+
+    Usage example:
+    app = FastAPI(dependencies=[Depends(unit_of_work_dependency, scope="function")])
+    """
+    if not unit_of_work_enabled():
+        yield None
+        return
+
+    async with async_unit_of_work() as uow:
+        yield uow
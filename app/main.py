@@ -1,16 +1,29 @@
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from starlette.staticfiles import StaticFiles
 
+from app.core.decorators.di import request_scope_dependency
 from app.core.paths.resource import __resources_path__
-from app.core.providers.app_service_providers import initialize_application
+from app.core.providers.app_service_providers import initialize_application, application_lifespan
+from app.core.service_containers.service_containers import get_registry
+from app.infrastructures.database.unit_of_work import unit_of_work_dependency
 from app.routes.api import register_routes
 
 import app.api.v1.middlewares
 
 load_dotenv()
 initialize_application()
-app = FastAPI()
+app = FastAPI(
+    lifespan=application_lifespan,
+    dependencies=[
+        Depends(request_scope_dependency),
+        # scope="function": the request transaction is committed before the response is sent
+        Depends(unit_of_work_dependency, scope="function"),
+    ],
+)
 
 app.mount("/static", StaticFiles(directory=f"{__resources_path__()}/public"), name="static")
-register_routes(app)
\ No newline at end of file
+register_routes(app)
+
+# Everything is registered: hot-path resolves read a frozen container
+get_registry().seal()
@@ -1,10 +1,51 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 from pydantic import BaseModel
-from sqlalchemy import Column, Integer, func, DateTime
+from sqlalchemy import Column, Index, Integer, func, DateTime, text
+from sqlalchemy.orm import declared_attr
 
 from app.infrastructures.database.database_infrastructure import Base
 
+# Dialects supporting partial indexes (CREATE INDEX ... WHERE)
+PARTIAL_INDEX_DIALECTS = ('postgresql', 'sqlite')
+
+LIVE_ROWS_PREDICATE = 'deleted_at IS NULL'
+
+def index_applies(index: Index, dialect_name: str) -> bool:
+    """
+    Whether an index declared by live_indexes() exists on the given dialect.
+    Also used by alembic/env.py so that autogenerate compares only the indexes of the current database.
+    """
+    partial = index.info.get('live_index')
+    if partial is None:
+        return True
+    return partial == (dialect_name in PARTIAL_INDEX_DIALECTS)
+
+def _ddl_if_applies(ddl, target, bind, **kw) -> bool:
+    return index_applies(target, kw['dialect'].name)
+
+def live_indexes(table_name: str, columns_list) -> Tuple[Index, ...]:
+    """
+    Indexes over the live (not soft deleted) rows, the rows every repository query reads.
+    PostgreSQL / SQLite: partial index on the columns WHERE deleted_at IS NULL, soft deleted rows are left out of it.
+    Other dialects (MySQL has no partial index): the same columns behind deleted_at.
+    :param columns_list: one tuple of column names per index
+    """
+    indexes = []
+    for columns in columns_list:
+        suffix = '_'.join(columns)
+        indexes.append(Index(
+            f'ix_{table_name}_live_{suffix}', *columns,
+            postgresql_where=text(LIVE_ROWS_PREDICATE),
+            sqlite_where=text(LIVE_ROWS_PREDICATE),
+            info={'live_index': True},
+        ).ddl_if(callable_=_ddl_if_applies))
+        indexes.append(Index(
+            f'ix_{table_name}_deleted_at_{suffix}', 'deleted_at', *columns,
+            info={'live_index': False},
+        ).ddl_if(callable_=_ddl_if_applies))
+    return tuple(indexes)
+
 class AbstractModel(Base):
     __abstract__ = True
     id = Column(Integer, primary_key=True)
@@ -13,9 +54,20 @@ class AbstractModel(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime, nullable=True)
 
+    # Column tuples indexed over the live rows, see live_indexes(): the default orderings of get_all / get_page
+    # (id, created_at + id tie-breaker). Subclasses extend it, e.g. AbstractModel.__live_indexes__ + (('name',),)
+    __live_indexes__: Tuple[Tuple[str, ...], ...] = (('id',), ('created_at', 'id'))
+
+    @declared_attr.directive
+    def __table_args__(cls):
+        """
+        A subclass defining its own __table_args__ should include live_indexes(cls.__tablename__, cls.__live_indexes__).
+        """
+        return live_indexes(cls.__tablename__, cls.__live_indexes__)
+
     def get_response_model(self) -> Optional[BaseModel]:
         """
         Returns the response model for the current model.
         This method should be overridden in subclasses to provide the specific response model.
         """
-        raise NotImplementedError("Subclasses must implement this method.")
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement this method.")
@@ -14,7 +14,8 @@ class User(AbstractModel):
     password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     avatar = Column(String(255), nullable=True)
-    token = Column(String(255), nullable=True)
+    # Looked up by Auth.decode_session_token on every authenticated request
+    token = Column(String(255), nullable=True, index=True)
 
     def get_response_model(self) -> Optional[BaseModel]:
         return UserResponseSchema
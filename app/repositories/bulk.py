@@ -0,0 +1,77 @@
+import datetime
+from typing import Iterable, Iterator, List, Optional
+
+from sqlalchemy import delete, inspect, select, update
+from sqlalchemy.engine import Dialect
+
+# Maximum number of ids bound in one "id IN (...)" clause, well below the bind parameter limit of every supported database
+BULK_CHUNK_SIZE = 1000
+
+def chunks(values: Iterable, size: int = BULK_CHUNK_SIZE) -> Iterator[list]:
+    chunk = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def supports_bulk_insert_returning(dialect: Dialect) -> bool:
+    """
+    Whether INSERT ... RETURNING can be used for a multi-row insert
+    (PostgreSQL, SQLite >= 3.35, MariaDB >= 10.5; not MySQL).
+    """
+    return bool(getattr(dialect, 'insert_executemany_returning', False))
+
+def supports_returning(dialect: Dialect, statement: str) -> bool:
+    """
+    Whether a single-row INSERT / UPDATE / DELETE can return the written row
+    (PostgreSQL, SQLite >= 3.35, MariaDB >= 10.5; not MySQL).
+    :param statement: insert, update or delete
+    """
+    return bool(getattr(dialect, f'{statement}_returning', False))
+
+def has_orm_delete_cascade(model_class) -> bool:
+    """
+    Whether deleting a row must go through session.delete(): a DELETE statement skips ORM-level cascades.
+    """
+    return any('delete' in relationship.cascade for relationship in inspect(model_class).relationships)
+
+def target_batches(model_class, ids: Optional[List[int]], where, with_trash: bool = False) -> List[list]:
+    """
+    WHERE clauses selecting the rows of a bulk statement, one list per statement to execute.
+    :param ids: primary keys of the rows, split into chunks of BULK_CHUNK_SIZE
+    :param where: SQLAlchemy predicate, combined with ids if both are given
+    :param with_trash: include soft deleted rows
+    :raise ValueError: if neither ids nor where is given (no accidental whole-table statement)
+    """
+    if ids is None and where is None:
+        raise ValueError("Either ids or where must be given")
+
+    conditions = []
+    if where is not None:
+        conditions.append(where)
+    if not with_trash and hasattr(model_class, 'deleted_at'):
+        conditions.append(model_class.deleted_at.is_(None))
+
+    if ids is None:
+        return [conditions]
+    return [conditions + [model_class.id.in_(chunk)] for chunk in chunks(ids)]
+
+def ids_statement(model_class, conditions: list):
+    """
+    SELECT of the primary keys matching conditions, e.g. the live rows of a target_batches() chunk.
+    """
+    return select(model_class.id).where(*conditions)
+
+def update_statement(model_class, conditions: list, values: dict):
+    # synchronize_session='fetch' keeps objects already loaded in the session in sync,
+    # 'evaluate' cannot handle arbitrary predicates
+    return update(model_class).where(*conditions).values(**values).execution_options(synchronize_session='fetch')
+
+def soft_delete_statement(model_class, conditions: list):
+    return update_statement(model_class, conditions, {'deleted_at': datetime.datetime.now()})
+
+def delete_statement(model_class, conditions: list):
+    return delete(model_class).where(*conditions).execution_options(synchronize_session='fetch')
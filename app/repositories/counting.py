@@ -0,0 +1,68 @@
+import os
+import threading
+from typing import Literal, Optional
+
+from sqlalchemy import column, func, select, table
+from sqlalchemy.engine import Dialect
+
+from app.repositories.query_cache import QueryCache, register_query_cache
+
+CountMode = Literal["exact", "estimated"]
+
+COUNT_MODES = ("exact", "estimated")
+
+_count_cache: Optional[QueryCache] = None
+_count_cache_lock = threading.Lock()
+
+def get_count_cache() -> QueryCache:
+    """
+    The process-wide cache of COUNT(*) results, one entry per filter set (compiled count statement).
+    Entries are dropped by any write to the counted table, like the query cache.
+    FASTIE_COUNT_CACHE_TTL sets how long a count is served (seconds, 0 to disable).
+    """
+    global _count_cache
+    if _count_cache is None:
+        with _count_cache_lock:
+            if _count_cache is None:
+                ttl = float(os.getenv("FASTIE_COUNT_CACHE_TTL") or 30.0)
+                cache = QueryCache(enabled=ttl > 0, max_entries=1000, max_bytes=1024 * 1024, ttl=ttl)
+                register_query_cache(cache)
+                _count_cache = cache
+    return _count_cache
+
+def estimate_statement(dialect: Dialect, table_name: str):
+    """
+    Row count estimate of a whole table from the database statistics, no table scan.
+    :return: a select() returning one value to pass to parse_estimate(), None if the dialect keeps no such statistics
+    """
+    if dialect.name == 'postgresql':
+        # reltuples is -1 until the table is first vacuumed / analyzed
+        return select(column('reltuples')).select_from(table('pg_class')).where(
+            column('oid') == func.to_regclass(table_name)
+        )
+    if dialect.name in ('mysql', 'mariadb'):
+        return select(column('TABLE_ROWS')).select_from(table('TABLES', schema='information_schema')).where(
+            column('TABLE_SCHEMA') == func.database(), column('TABLE_NAME') == table_name
+        )
+    if dialect.name == 'sqlite':
+        # Only exists after ANALYZE, the first number of stat is the row count
+        return select(column('stat')).select_from(table('sqlite_stat1')).where(column('tbl') == table_name).limit(1)
+    return None
+
+def parse_estimate(value) -> Optional[int]:
+    """
+    :return: the estimated row count, None when the statistics are missing
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(' ', 1)[0]
+    try:
+        estimate = int(float(value))
+    except (TypeError, ValueError):
+        return None
+    return estimate if estimate >= 0 else None
+
+def validate_count_mode(mode: Optional[str]):
+    if mode is not None and mode not in COUNT_MODES:
+        raise ValueError(f"Count mode must be one of {', '.join(COUNT_MODES)}")
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+MISSING = object()
+# Cached "no row with this id"
+NEGATIVE = object()
+
+# Identity caches of every repository, by model class: a write through any session invalidates them all
+_model_caches: Dict[type, List['IdentityCache']] = {}
+_model_caches_lock = threading.Lock()
+
+_PENDING_KEY = 'fastie_identity_cache_pending'
+
+class IdentityCache:
+    """
+    Bounded LRU + TTL cache of rows by primary key, holding column snapshots rather than ORM objects.
+    The cache is per process: other workers see a write once their entry expires (ttl).
+    Every invalidation bumps the cache version: a row read before a write committed is not stored after it
+    (see put()), so a concurrent reader cannot bring the old row back.
+    """
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0, negative_ttl: float = 5.0):
+        """
+        :param max_size: maximum number of entries, least recently used entries are evicted first
+        :param ttl: seconds a row snapshot is served
+        :param negative_ttl: seconds a "not found" result is served
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: 'OrderedDict[Any, tuple]' = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """
+        :return: the column snapshot, NEGATIVE for a cached miss, or MISSING
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            if value is NEGATIVE:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return value
+
+    @property
+    def version(self) -> int:
+        """
+        Take it before reading a row from the database, and pass it to put().
+        """
+        return self._version
+
+    def put(self, key, snapshot: Optional[dict], version: Optional[int] = None):
+        """
+        :param snapshot: column values of the row, None to cache its absence
+        :param version: version taken before the row was read, the row is not stored if the cache was invalidated since
+        """
+        value, ttl = (NEGATIVE, self.negative_ttl) if snapshot is None else (snapshot, self.ttl)
+        with self._lock:
+            # Written (and maybe committed) while the row was read: it may already be stale
+            if version is not None and version != self._version:
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            self._version += 1
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._version += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'negative_hits': self.negative_hits,
+                'misses': self.misses,
+                'hit_ratio': round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+def register_identity_cache(model_class, cache: IdentityCache):
+    with _model_caches_lock:
+        _model_caches[model_class] = _model_caches.get(model_class, []) + [cache]
+
+def _invalidate(model_class, ids: Optional[Iterable]):
+    for cache in _model_caches.get(model_class, ()):
+        if ids is None:
+            cache.clear()
+        else:
+            for id in ids:
+                cache.invalidate(id)
+
+def record_writes(session: Session, model_class, ids: Optional[Iterable] = None):
+    """
+    Invalidate the cached rows written by session, now and again when its transaction commits
+    (a concurrent reader may have cached the old row in between).
+    :param ids: written primary keys, None when the written rows are unknown (whole model invalidated)
+    """
+    if model_class not in _model_caches:
+        return
+    ids = None if ids is None else list(ids)
+    _invalidate(model_class, ids)
+    session.info.setdefault(_PENDING_KEY, []).append((model_class, ids))
+
+def has_pending_writes(session: Session) -> bool:
+    """
+    A session with uncommitted writes bypasses the cache: it must see its own changes,
+    and must not publish them before they are committed.
+    """
+    return bool(session.info.get(_PENDING_KEY))
+
+def snapshot(instance) -> dict:
+    return {attr.key: getattr(instance, attr.key) for attr in inspect(instance).mapper.column_attrs}
+
+def attach_snapshot(session: Session, model_class, data: dict):
+    """
+    Rebuild a persistent instance from a snapshot without a SELECT.
+    The instance behaves as if it was just loaded: it can be updated or deleted through the session.
+    """
+    mapper = inspect(model_class)
+    key = mapper.identity_key_from_primary_key([data[column.key] for column in mapper.primary_key])
+    existing = session.identity_map.get(key)
+    if existing is not None:
+        return existing
+
+    instance = mapper.class_manager.new_instance()
+    for name, value in data.items():
+        set_committed_value(instance, name, value)
+    make_transient_to_detached(instance)
+    session.add(instance)
+    return instance
+
+@event.listens_for(Session, 'after_flush')
+def _after_flush(session, flush_context):
+    written = {}
+    for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+        model_class = type(instance)
+        if model_class in _model_caches:
+            written.setdefault(model_class, []).append(getattr(instance, 'id', None))
+    for model_class, ids in written.items():
+        record_writes(session, model_class, None if None in ids else ids)
+
+@event.listens_for(Session, 'after_commit')
+def _after_commit(session):
+    for model_class, ids in session.info.pop(_PENDING_KEY, ()):
+        _invalidate(model_class, ids)
+
+@event.listens_for(Session, 'after_rollback')
+def _after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
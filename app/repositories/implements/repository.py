@@ -1,10 +1,25 @@
-import datetime
-from typing import TypeVar, Generic, Optional, List, Literal
-
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, asc, inspect
-
+from contextvars import Token
+from typing import TypeVar, Generic, Optional, List, Literal, Iterator, Tuple, Union
+
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy import desc, asc, inspect, insert, update, select
+
+from app.infrastructures.database.session_context import bind_session, current_session
+from app.repositories.bulk import (
+    has_orm_delete_cascade, supports_bulk_insert_returning, supports_returning, target_batches, update_statement,
+    soft_delete_statement, delete_statement, ids_statement
+)
+from app.repositories.counting import (
+    CountMode, estimate_statement, get_count_cache, parse_estimate, validate_count_mode
+)
+from app.repositories.identity_cache import (
+    IdentityCache, MISSING, NEGATIVE, attach_snapshot, has_pending_writes, record_writes, register_identity_cache, snapshot
+)
+from app.repositories.pagination import Page, build_page, keyset_params
+from app.repositories.projection import projection_columns, projection_keys
+from app.repositories.query_cache import CACHE_MISS, QueryCache, get_query_cache, has_pending_table_writes
+from app.repositories.statements import by_id_statement, count_statement, list_statement, page_statement
 from app.repositories.interfaces.i_repository import IRepository
 
 T = TypeVar('T')
@@ -13,16 +28,58 @@ TUpdate = TypeVar('TUpdate')
 
 class Repository(IRepository[T, TCreate, TUpdate], Generic[T, TCreate, TUpdate]):
 
+    # Set by @repository(identity_cache=..., query_cache=...)
+    identity_cache_options: Optional[dict] = None
+    query_cache_enabled: bool = False
+
     def __init__(self, model_class):
         self.model_class = model_class
-        self.session: Optional[Session] = None
+        self.identity_cache: Optional[IdentityCache] = None
+        if self.identity_cache_options is not None:
+            self.identity_cache = IdentityCache(**self.identity_cache_options)
+            register_identity_cache(model_class, self.identity_cache)
+        self.query_cache: Optional[QueryCache] = get_query_cache() if self.query_cache_enabled else None
+
+    @property
+    def session(self) -> Session:
+        """
+        Session bound to the current thread / task by the enclosing DbContext.
+        Repositories are singletons shared by concurrent requests, so the session is never stored on the instance.
+        """
+        session = current_session()
+        if session is None:
+            raise RuntimeError(f"No database session bound to the current context, use {type(self).__name__} inside a DbContext")
+        return session
+
+    def set_session(self, session: Session) -> Token:
+        """
+        Bind a session to the current context (thread / task) only.
+        Not needed inside a DbContext, which binds its session itself.
+        :return: token to pass to unbind_session() once done, to restore the previous binding
+        """
+        return bind_session(session)
+
 
-    def set_session(self, session: Session):
+    def _fetch_rows(self, stmt, params: Optional[dict] = None, cache: Optional[QueryCache] = None) -> list:
         """
-        Set the SQLAlchemy session for database operations.
-        This method should be called before any database operations.
+        Execute a projected select, through the query cache when it is enabled for this repository.
+        :param params: bound parameters of the statement
+        :param cache: cache to use instead of the repository query cache (e.g. the count cache)
         """
-        self.session = session
+        cache = cache if cache is not None else self.query_cache
+        if cache is None or not cache.enabled or has_pending_table_writes(self.session):
+            return list(self.session.execute(stmt, params).all())
+
+        key, tables, versions, rows = cache.lookup(stmt, self.session.get_bind().dialect, params)
+        if rows is CACHE_MISS:
+            rows = list(self.session.execute(stmt, params).all())
+            cache.store(key, tables, versions, rows)
+        return rows
+
+    def _fetch_entities(self, stmt, params: dict, eager_relations: tuple) -> list:
+        result = self.session.scalars(stmt, params)
+        # Joined eager loading of collections repeats the parent row
+        return list(result.unique() if eager_relations else result)
 
 
     def get_all(
@@ -33,21 +90,113 @@ class Repository(IRepository[T, TCreate, TUpdate], Generic[T, TCreate, TUpdate])
             order_direction: Literal["asc", "desc"] = "asc",
             with_trash: bool = False,
             eager_relations: Optional[List[str]] = None,
-    ) -> List[T]:
-        query = self.session.query(self.model_class)
+            projection=None,
+            total: Optional[CountMode] = None,
+    ) -> Union[List[T], Page[T]]:
+        """
+        :param projection: response schema (or column names) to select only the needed columns:
+                           plain rows are returned instead of entities, outside of the identity map
+        :param total: exact or estimated to return a Page with the total count and has_more instead of a list
+        """
+        validate_count_mode(total)
+        columns = projection_keys(self.model_class, projection)
+        eager = () if columns else tuple(eager_relations or ())
+        stmt = list_statement(self.model_class, columns, eager, with_trash, order_by, order_direction)
+
+        # One extra row tells whether there is a next page
+        params = {'skip': skip, 'limit': limit if total is None else limit + 1}
+        items = self._fetch_rows(stmt, params) if columns else self._fetch_entities(stmt, params, eager)
+        if total is None:
+            return items
+        count, estimated = self._count(with_trash, total)
+        return Page(items=items[:limit], has_more=len(items) > limit, total=count, total_estimated=estimated)
 
-        if eager_relations:
-            for relation in eager_relations:
-                query = query.options(joinedload(getattr(self.model_class, relation)))
+
+    def get_page(
+            self,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+            order_by: str = "id",
+            order_direction: Literal["asc", "desc"] = "asc",
+            with_trash: bool = False,
+            eager_relations: Optional[List[str]] = None,
+            projection=None,
+            total: Optional[CountMode] = None,
+    ) -> Page[T]:
+        validate_count_mode(total)
+        # The keyset columns are needed to build the next cursor
+        columns = projection_keys(self.model_class, projection, required=(order_by, 'id'))
+        eager = () if columns else tuple(eager_relations or ())
+
+        # Seek past the cursor instead of OFFSET: every page costs the same index range scan
+        stmt = page_statement(self.model_class, columns, eager, with_trash, order_by, order_direction, bool(cursor))
+        params = keyset_params(self.model_class, limit, order_by, order_direction, cursor)
+        rows = self._fetch_rows(stmt, params) if columns else self._fetch_entities(stmt, params, eager)
+        page = build_page(rows, self.model_class, limit, order_by, order_direction)
+        if total is not None:
+            page.total, page.total_estimated = self._count(with_trash, total)
+        return page
+
+
+    def count(self, with_trash: bool = False, mode: CountMode = "exact") -> int:
+        return self._count(with_trash, mode)[0]
+
+    def _count(self, with_trash: bool, mode: CountMode) -> Tuple[int, bool]:
+        """
+        :return: (row count, whether it is an estimate)
+        """
+        validate_count_mode(mode)
+        if mode == "estimated":
+            stmt = estimate_statement(self.session.get_bind().dialect, inspect(self.model_class).local_table.name)
+            if stmt is not None:
+                try:
+                    estimate = parse_estimate(self.session.execute(stmt).scalar())
+                except DBAPIError:
+                    # e.g. SQLite before the first ANALYZE
+                    estimate = None
+                if estimate is not None:
+                    return estimate, True
+
+        # Cached per filter set, dropped by any write to the table
+        rows = self._fetch_rows(count_statement(self.model_class, with_trash), cache=get_count_cache())
+        return rows[0][0], False
+
+
+    def stream(
+            self,
+            batch_size: int = 1000,
+            order_by: Optional[str] = None,
+            order_direction: Literal["asc", "desc"] = "asc",
+            with_trash: bool = False,
+            projection=None,
+    ) -> Iterator[T]:
+        """
+        Iterate over every record in constant memory: rows are fetched batch_size at a time
+        (server-side cursor where the driver supports it) and each batch is expunged from the session once consumed.
+        """
+        # Resolved once: the generator may be resumed in another context (e.g. by a StreamingResponse)
+        session = self.session
+        columns = projection_columns(self.model_class, projection)
+        stmt = select(*columns) if columns else select(self.model_class)
 
         if not with_trash and hasattr(self.model_class, 'deleted_at'):
-            query = query.filter(self.model_class.deleted_at.is_(None))
+            stmt = stmt.where(self.model_class.deleted_at.is_(None))
 
         if order_by:
             column = getattr(self.model_class, order_by)
-            query = query.order_by(desc(column) if order_direction == "desc" else asc(column))
+            stmt = stmt.order_by(desc(column) if order_direction == "desc" else asc(column))
 
-        return query.offset(skip).limit(limit).all()
+        stmt = stmt.execution_options(yield_per=batch_size)
+        result = session.execute(stmt) if columns else session.scalars(stmt)
+        try:
+            for partition in result.partitions():
+                yield from partition
+                # Projected rows are not tracked by the session
+                if not columns:
+                    for item in partition:
+                        session.expunge(item)
+        finally:
+            result.close()
 
 
     def get_by_id(
@@ -56,94 +205,198 @@ class Repository(IRepository[T, TCreate, TUpdate], Generic[T, TCreate, TUpdate])
             with_trash: bool = False,
             eager_relations: Optional[List[str]] = None,
     ) -> Optional[T]:
-        query = self.session.query(self.model_class).filter(self.model_class.id == id)
-
-        if eager_relations:
-            for relation in eager_relations:
-                query = query.options(joinedload(getattr(self.model_class, relation)))
-
-        if not with_trash and hasattr(self.model_class, 'deleted_at'):
-            query = query.filter(self.model_class.deleted_at.is_(None))
-
-        return query.first()
-
-
+        cache = self._usable_identity_cache(with_trash, eager_relations)
+        if cache is not None:
+            version = cache.version
+            cached = cache.get(id)
+            if cached is NEGATIVE:
+                return None
+            if cached is not MISSING:
+                return attach_snapshot(self.session, self.model_class, cached)
+
+        eager = tuple(eager_relations or ())
+        stmt = by_id_statement(self.model_class, with_trash, eager)
+        result = self.session.scalars(stmt, {'id': id})
+        item = (result.unique() if eager else result).first()
+        if cache is not None:
+            cache.put(id, snapshot(item) if item is not None else None, version)
+        return item
+
+    def _usable_identity_cache(self, with_trash: bool, eager_relations) -> Optional[IdentityCache]:
+        # Only plain lookups are cached, and not while the transaction has uncommitted writes
+        if self.identity_cache is None or with_trash or eager_relations:
+            return None
+        if has_pending_writes(self.session):
+            return None
+        return self.identity_cache
+
+
+
+    def _column_data(self, data) -> dict:
+        # Get raw data from model
+        if hasattr(data, 'model_dump'):
+            raw_data = data.model_dump(exclude_unset=True)
+        elif hasattr(data, 'dict'):
+            raw_data = data.dict(exclude_unset=True)
+        else:
+            raw_data = data
+
+        # Filter valid columns
+        mapper = inspect(self.model_class)
+        valid_keys = {c.key for c in mapper.columns}
+        return {k: v for k, v in raw_data.items() if k in valid_keys}
 
     def create(self, data: TCreate) -> T:
         try:
-            # Get raw data from model
-            if hasattr(data, 'model_dump'):
-                raw_data = data.model_dump(exclude_unset=True)
-            else:
-                raw_data = data.dict(exclude_unset=True)
-
-            # Filter valid columns
-            mapper = inspect(self.model_class)
-            valid_keys = {c.key for c in mapper.columns}
-            item_data = {k: v for k, v in raw_data.items() if k in valid_keys}
-
-            # Create and persist the item
-            with self.session.begin():
-                db_item = self.model_class(**item_data)
-                self.session.add(db_item)
-                self.session.flush()
+            item_data = self._column_data(data)
+
+            # The transaction is committed by the DbContext / unit of work
+            if supports_returning(self.session.get_bind().dialect, 'insert'):
+                # One INSERT ... RETURNING: the generated id and column defaults come back with the insert,
+                # the returned entity is persistent and fully loaded
+                db_item = self.session.scalars(insert(self.model_class).returning(self.model_class), [item_data]).one()
+                record_writes(self.session, self.model_class, [db_item.id])
+                return db_item
+
+            # No RETURNING (MySQL): the flush reads back the generated id, the refresh loads the column defaults
+            db_item = self.model_class(**item_data)
+            self.session.add(db_item)
+            self.session.flush()
 
             self.session.refresh(db_item)
             return db_item
 
         except IntegrityError as e:
-            self.session.rollback()
             raise ValueError(f"Integrity error: {str(e)}")
         except Exception as e:
-            self.session.rollback()
             raise ValueError(f"Error creating item: {str(e)}")
 
     def update(self, id: int, data: TUpdate) -> T:
         try:
+            item_data = self._column_data(data)
+            item_data.pop('id', None)
+
+            if item_data and supports_returning(self.session.get_bind().dialect, 'update'):
+                # One UPDATE ... WHERE id = ? RETURNING instead of SELECT + UPDATE + SELECT,
+                # an instance of the row already in the session is refreshed with the returned values
+                conditions = target_batches(self.model_class, [id], None)[0]
+                stmt = update(self.model_class).where(*conditions).values(**item_data).returning(self.model_class)
+                db_item = self.session.scalars(stmt).one_or_none()
+                if db_item is None:
+                    raise ValueError(f"Item with id {id} not found")
+                record_writes(self.session, self.model_class, [id])
+                return db_item
+
             db_item = self.get_by_id(id)
             if db_item is None:
                 raise ValueError(f"Item with id {id} not found")
 
-            # Get raw data from model
-            if hasattr(data, 'model_dump'):
-                raw_data = data.model_dump(exclude_unset=True)
-            elif hasattr(data, 'dict'):
-                raw_data = data.dict(exclude_unset=True)
-            else:
-                raw_data = data
-
-            # Filter valid columns
-            mapper = inspect(self.model_class)
-            valid_keys = {c.key for c in mapper.columns}
-            item_data = {k: v for k, v in raw_data.items() if k in valid_keys}
-
             # Update the item
-            with self.session.begin():
-                for key, value in item_data.items():
-                    setattr(db_item, key, value)
+            for key, value in item_data.items():
+                setattr(db_item, key, value)
+            self.session.flush()
 
             self.session.refresh(db_item)
             return db_item
 
         except IntegrityError as e:
-            self.session.rollback()
             raise ValueError(f"Integrity error: {str(e)}")
         except Exception as e:
-            self.session.rollback()
             raise ValueError(f"Error updating item: {str(e)}")
 
     def delete(self, id: int) -> None:
-        db_item = self.get_by_id(id)
-        if db_item is None:
+        # A single UPDATE, the row count tells whether the item existed
+        conditions = target_batches(self.model_class, [id], None)[0]
+        if self.session.execute(soft_delete_statement(self.model_class, conditions)).rowcount == 0:
             raise ValueError(f"Item with id {id} not found")
-        db_item.deleted_at = datetime.datetime.now()
-        self.session.commit()
-        pass
+        record_writes(self.session, self.model_class, [id])
 
     def force_delete(self, id: int) -> None:
+        if not has_orm_delete_cascade(self.model_class):
+            conditions = target_batches(self.model_class, [id], None)[0]
+            if self.session.execute(delete_statement(self.model_class, conditions)).rowcount == 0:
+                raise ValueError(f"Item with id {id} not found")
+            record_writes(self.session, self.model_class, [id])
+            return
+
+        # ORM cascades (e.g. delete-orphan children) need the loaded instance
         db_item = self.get_by_id(id)
         if db_item is None:
             raise ValueError(f"Item with id {id} not found")
 
         self.session.delete(db_item)
-        self.session.commit()
\ No newline at end of file
+        self.session.flush()
+
+    def create_many(self, items: List[TCreate]) -> List[T]:
+        try:
+            rows = [self._column_data(item) for item in items]
+            if not rows:
+                return []
+
+            if supports_bulk_insert_returning(self.session.get_bind().dialect):
+                # Multi-row INSERT ... RETURNING: the created rows come back from the insert itself
+                # sort_by_parameter_order would make SQLite fall back to one INSERT per row,
+                # generated ids follow the insertion order instead
+                stmt = insert(self.model_class).returning(self.model_class)
+                db_items = sorted(self.session.scalars(stmt, rows).all(), key=lambda item: item.id)
+                # Bulk statements bypass the flush: drop cached "not found" entries of the new ids
+                record_writes(self.session, self.model_class, [item.id for item in db_items])
+                return db_items
+
+            # No RETURNING (MySQL): the flush batches the INSERTs and reads back the generated ids
+            db_items = [self.model_class(**row) for row in rows]
+            self.session.add_all(db_items)
+            self.session.flush()
+            return db_items
+
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Error creating items: {str(e)}")
+
+    def update_many(self, data, ids: Optional[List[int]] = None, where=None) -> int:
+        try:
+            if isinstance(data, list):
+                # One executemany UPDATE ... WHERE id = ? for per-row values
+                rows = [self._column_data(item) for item in data]
+                if any('id' not in row for row in rows):
+                    raise ValueError("Every item of a bulk update needs an id")
+                # The UPDATE by primary key matches any row: keep the ones the other bulk methods would select
+                # (existing, not soft deleted), so the count is the number of rows actually updated
+                live_ids = set()
+                for conditions in target_batches(self.model_class, [row['id'] for row in rows], None):
+                    live_ids.update(self.session.scalars(ids_statement(self.model_class, conditions)).all())
+                rows = [row for row in rows if row['id'] in live_ids]
+                if rows:
+                    self.session.execute(update(self.model_class), rows)
+                    record_writes(self.session, self.model_class, [row['id'] for row in rows])
+                return len(rows)
+
+            values = self._column_data(data)
+            values.pop('id', None)
+            if not values:
+                return 0
+            count = 0
+            for conditions in target_batches(self.model_class, ids, where):
+                count += self.session.execute(update_statement(self.model_class, conditions, values)).rowcount
+            record_writes(self.session, self.model_class, ids if where is None else None)
+            return count
+
+        except IntegrityError as e:
+            raise ValueError(f"Integrity error: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Error updating items: {str(e)}")
+
+    def delete_many(self, ids: Optional[List[int]] = None, where=None) -> int:
+        count = 0
+        for conditions in target_batches(self.model_class, ids, where):
+            count += self.session.execute(soft_delete_statement(self.model_class, conditions)).rowcount
+        record_writes(self.session, self.model_class, ids if where is None else None)
+        return count
+
+    def force_delete_many(self, ids: Optional[List[int]] = None, where=None) -> int:
+        count = 0
+        for conditions in target_batches(self.model_class, ids, where, with_trash=True):
+            count += self.session.execute(delete_statement(self.model_class, conditions)).rowcount
+        record_writes(self.session, self.model_class, ids if where is None else None)
+        return count
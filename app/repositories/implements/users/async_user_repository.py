@@ -0,0 +1,9 @@
+from app.core.decorators.di import repository
+from app.repositories.interfaces.user.i_async_user_repository import IAsyncUserRepository
+from app.repositories.implements.async_repository import AsyncRepository
+from app.models.user import User
+
+@repository
+class AsyncUserRepository(AsyncRepository, IAsyncUserRepository):
+    def __init__(self):
+        super().__init__(User)
@@ -0,0 +1,146 @@
+from abc import ABC, abstractmethod
+from contextvars import Token
+from typing import TypeVar, Generic, Optional, List, Literal, AsyncIterator, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.counting import CountMode
+from app.repositories.pagination import Page
+
+T = TypeVar("T")
+TCreate = TypeVar("TCreate")
+TUpdate = TypeVar("TUpdate")
+
+class IAsyncRepository(ABC, Generic[T, TCreate, TUpdate]):
+    @abstractmethod
+    def set_session(self, session: AsyncSession) -> Token:
+        """
+        Set the SQLAlchemy async session for database operations, in the current context only.
+        :return: token to pass to unbind_async_session() to restore the previous session
+        """
+        pass
+
+
+    @abstractmethod
+    async def get_all(
+            self,
+            skip: int = 0,
+            limit: int = 100,
+            order_by: Optional[str] = None,
+            order_direction: Literal["asc", "desc"] = "asc",
+            projection=None,
+            total: Optional[CountMode] = None
+    ) -> Union[List[T], Page[T]]:
+        """
+        Retrieve all records with optional pagination and sorting.
+        :param projection: response schema (or column names): select only those columns and return plain rows
+        :param total: exact or estimated to return a Page with the total count and has_more instead of a list
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(
+            self,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+            order_by: str = "id",
+            order_direction: Literal["asc", "desc"] = "asc",
+            projection=None,
+            total: Optional[CountMode] = None
+    ) -> Page[T]:
+        """
+        Retrieve one page of records with keyset (cursor) pagination.
+        :param cursor: next_cursor of the previous page, None for the first page
+        :param order_by: non nullable column to order by, the id is used as tie-breaker
+        :param projection: response schema (or column names): select only those columns and return plain rows
+        :param total: exact or estimated to also set the total count of the page
+        """
+        pass
+
+    @abstractmethod
+    async def count(self, with_trash: bool = False, mode: CountMode = "exact") -> int:
+        """
+        Count the records, cached per filter set until the table is written or the cache TTL expires.
+        :param mode: exact (COUNT(*)), or estimated from the database statistics of the whole table
+                     (soft deleted rows included), falling back to exact when the dialect has none
+        """
+        pass
+
+    @abstractmethod
+    def stream(
+            self,
+            batch_size: int = 1000,
+            order_by: Optional[str] = None,
+            order_direction: Literal["asc", "desc"] = "asc",
+            projection=None
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over every record without loading them all in memory.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, id: int) -> Optional[T]:
+        """Retrieve a single record by ID."""
+        pass
+
+    @abstractmethod
+    async def create(self, data: TCreate) -> T:
+        """Create a new record."""
+        pass
+
+    @abstractmethod
+    async def update(self, id: int, data: TUpdate) -> T:
+        """Update an existing record by ID."""
+        pass
+
+    @abstractmethod
+    async def delete(self, id: int) -> None:
+        """
+        Soft delete a record by ID.
+        :param id: id of the record to delete
+        :return:  None
+        """
+        pass
+
+
+    @abstractmethod
+    async def force_delete(self, id: int) -> None:
+        """Delete a record by ID."""
+        pass
+
+    @abstractmethod
+    async def create_many(self, items: List[TCreate]) -> List[T]:
+        """
+        Create many records with set-based INSERTs (multi-row INSERT ... RETURNING when the dialect supports it).
+        """
+        pass
+
+    @abstractmethod
+    async def update_many(self, data, ids: Optional[List[int]] = None, where=None) -> int:
+        """
+        Update many records in a few statements.
+        :param data: values applied to every row matching ids / where,
+                     or a list of per-row values each containing the id (executemany UPDATE by primary key,
+                     ids of missing or soft deleted rows are skipped)
+        :param ids: ids of the rows to update
+        :param where: SQLAlchemy predicate selecting the rows to update
+        :return: number of updated rows
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(self, ids: Optional[List[int]] = None, where=None) -> int:
+        """
+        Soft delete the records matching ids / where with UPDATE statements.
+        :return: number of deleted rows
+        """
+        pass
+
+    @abstractmethod
+    async def force_delete_many(self, ids: Optional[List[int]] = None, where=None) -> int:
+        """
+        Delete the records matching ids / where with DELETE statements.
+        :return: number of deleted rows
+        """
+        pass
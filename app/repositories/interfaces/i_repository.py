@@ -1,16 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Optional, List, Literal
+from contextvars import Token
+from typing import TypeVar, Generic, Optional, List, Literal, Iterator, Union
 
 from sqlalchemy.orm import Session
 
+from app.repositories.counting import CountMode
+from app.repositories.pagination import Page
+
 T = TypeVar("T")
 TCreate = TypeVar("TCreate")
 TUpdate = TypeVar("TUpdate")
 
 class IRepository(ABC, Generic[T, TCreate, TUpdate]):
     @abstractmethod
-    def set_session(self, session: Session):
-        """Set the SQLAlchemy session for database operations."""
+    def set_session(self, session: Session) -> Token:
+        """
+        Set the SQLAlchemy session for database operations, in the current context only.
+        :return: token to pass to unbind_session() to restore the previous session
+        """
         pass
 
 
@@ -20,10 +27,55 @@ class IRepository(ABC, Generic[T, TCreate, TUpdate]):
             skip: int = 0,
             limit: int = 100,
             order_by: Optional[str] = None,
-            order_direction: Literal["asc", "desc"] = "asc"
-    ) -> List[T]:
+            order_direction: Literal["asc", "desc"] = "asc",
+            projection=None,
+            total: Optional[CountMode] = None
+    ) -> Union[List[T], Page[T]]:
         """
         Retrieve all records with optional pagination and sorting.
+        :param projection: response schema (or column names): select only those columns and return plain rows
+        :param total: exact or estimated to return a Page with the total count and has_more instead of a list
+        """
+        pass
+
+    @abstractmethod
+    def get_page(
+            self,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+            order_by: str = "id",
+            order_direction: Literal["asc", "desc"] = "asc",
+            projection=None,
+            total: Optional[CountMode] = None
+    ) -> Page[T]:
+        """
+        Retrieve one page of records with keyset (cursor) pagination.
+        :param cursor: next_cursor of the previous page, None for the first page
+        :param order_by: non nullable column to order by, the id is used as tie-breaker
+        :param projection: response schema (or column names): select only those columns and return plain rows
+        :param total: exact or estimated to also set the total count of the page
+        """
+        pass
+
+    @abstractmethod
+    def count(self, with_trash: bool = False, mode: CountMode = "exact") -> int:
+        """
+        Count the records, cached per filter set until the table is written or the cache TTL expires.
+        :param mode: exact (COUNT(*)), or estimated from the database statistics of the whole table
+                     (soft deleted rows included), falling back to exact when the dialect has none
+        """
+        pass
+
+    @abstractmethod
+    def stream(
+            self,
+            batch_size: int = 1000,
+            order_by: Optional[str] = None,
+            order_direction: Literal["asc", "desc"] = "asc",
+            projection=None
+    ) -> Iterator[T]:
+        """
+        Iterate over every record without loading them all in memory.
         """
         pass
 
@@ -56,3 +108,39 @@ class IRepository(ABC, Generic[T, TCreate, TUpdate]):
     def force_delete(self, id: int) -> None:
         """Delete a record by ID."""
         pass
+
+    @abstractmethod
+    def create_many(self, items: List[TCreate]) -> List[T]:
+        """
+        Create many records with set-based INSERTs (multi-row INSERT ... RETURNING when the dialect supports it).
+        """
+        pass
+
+    @abstractmethod
+    def update_many(self, data, ids: Optional[List[int]] = None, where=None) -> int:
+        """
+        Update many records in a few statements.
+        :param data: values applied to every row matching ids / where,
+                     or a list of per-row values each containing the id (executemany UPDATE by primary key,
+                     ids of missing or soft deleted rows are skipped)
+        :param ids: ids of the rows to update
+        :param where: SQLAlchemy predicate selecting the rows to update
+        :return: number of updated rows
+        """
+        pass
+
+    @abstractmethod
+    def delete_many(self, ids: Optional[List[int]] = None, where=None) -> int:
+        """
+        Soft delete the records matching ids / where with UPDATE statements.
+        :return: number of deleted rows
+        """
+        pass
+
+    @abstractmethod
+    def force_delete_many(self, ids: Optional[List[int]] = None, where=None) -> int:
+        """
+        Delete the records matching ids / where with DELETE statements.
+        :return: number of deleted rows
+        """
+        pass
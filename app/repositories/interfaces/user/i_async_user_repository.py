@@ -0,0 +1,10 @@
+from abc import ABC
+
+from app.models.user import User
+from app.repositories.interfaces.i_async_repository import IAsyncRepository
+from app.schemas.models.user.user_create_schema import UserCreateSchema
+from app.schemas.models.user.user_update_schema import UserUpdateSchema
+
+
+class IAsyncUserRepository(IAsyncRepository[User, UserCreateSchema, UserUpdateSchema], ABC):
+    pass
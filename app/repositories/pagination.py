@@ -0,0 +1,155 @@
+import base64
+import binascii
+import datetime
+import json
+from dataclasses import dataclass, field, replace
+from typing import Generic, List, Literal, Optional, TypeVar
+
+from sqlalchemy import DateTime, String, and_, asc, bindparam, desc, or_
+from sqlalchemy.types import TypeDecorator
+
+T = TypeVar('T')
+
+@dataclass
+class Page(Generic[T]):
+    """
+    One page of a paginated listing.
+    next_cursor is None on the last page (and for offset pages).
+    total is only set when a count was requested, total_estimated tells it comes from the database statistics.
+    """
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total: Optional[int] = None
+    total_estimated: bool = False
+
+    def map(self, mapper) -> 'Page':
+        """
+        Same page with every item converted by mapper (e.g. a response model).
+        """
+        return replace(self, items=[mapper(item) for item in self.items])
+
+def _keyset_columns(model_class, order_by: str) -> list:
+    """
+    Ordering columns of the keyset: order_by, plus the primary key as tie-breaker.
+    """
+    column = getattr(model_class, order_by, None)
+    if column is None or not hasattr(column, 'property') or not hasattr(column.property, 'columns'):
+        raise ValueError(f"Cannot paginate {model_class.__name__} by {order_by}")
+    if column.property.columns[0].nullable:
+        raise ValueError(f"Cannot paginate by nullable column {order_by}")
+    if order_by == 'id':
+        return [model_class.id]
+    return [column, model_class.id]
+
+class _CursorDateTime(TypeDecorator):
+    """
+    Type of a datetime cursor value bound in the seek condition.
+    SQLite stores datetimes as text and compares them as text: a DEFAULT now() value (CURRENT_TIMESTAMP) is
+    'YYYY-MM-DD HH:MM:SS' while the DateTime type binds 'YYYY-MM-DD HH:MM:SS.ffffff', which sorts after every
+    row of the same second. The value is bound in the stored format instead, fraction only when there is one.
+    """
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'sqlite':
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime())
+
+    def process_bind_param(self, value, dialect):
+        if dialect.name == 'sqlite' and isinstance(value, datetime.datetime):
+            timespec = 'microseconds' if value.microsecond else 'seconds'
+            return value.replace(tzinfo=None).isoformat(' ', timespec=timespec)
+        return value
+
+def _cursor_bindparam(name: str, column):
+    if column.type.python_type is datetime.datetime:
+        return bindparam(name, type_=_CursorDateTime())
+    return bindparam(name, type_=column.type)
+
+def encode_cursor(order_by: str, order_direction: str, values: list) -> str:
+    """
+    Opaque cursor pointing right after the row whose ordering values are given.
+    """
+    values = [value.isoformat() if isinstance(value, (datetime.datetime, datetime.date)) else value for value in values]
+    raw = json.dumps([order_by, order_direction, values], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+def decode_cursor(cursor: str, order_by: str, order_direction: str, columns: list) -> list:
+    """
+    :return: the ordering values stored in the cursor
+    :raise ValueError: if the cursor is malformed or was issued for another ordering
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        cursor_order_by, cursor_direction, values = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("Invalid cursor") from None
+    if cursor_order_by != order_by or cursor_direction != order_direction or len(values) != len(columns):
+        raise ValueError("Cursor does not match the requested ordering")
+
+    decoded = []
+    for column, value in zip(columns, values):
+        if isinstance(value, str) and column.type.python_type is datetime.datetime:
+            value = datetime.datetime.fromisoformat(value)
+        decoded.append(value)
+    return decoded
+
+def keyset_statement(
+        stmt,
+        model_class,
+        order_by: str = 'id',
+        order_direction: Literal["asc", "desc"] = "asc",
+        after_cursor: bool = False,
+):
+    """
+    Order a select() in keyset order and, after_cursor, restrict it to the rows after the cursor.
+    The cursor values and the limit are bound parameters (see keyset_params): the statement can be built once per shape.
+    The seek condition is expanded to (a > x) OR (a = x AND id > y) so it can use a plain (a, id) index.
+    """
+    if order_direction not in ("asc", "desc"):
+        raise ValueError("order_direction must be 'asc' or 'desc'")
+    columns = _keyset_columns(model_class, order_by)
+
+    if after_cursor:
+        values = [_cursor_bindparam(f'keyset_{i}', column) for i, column in enumerate(columns)]
+        conditions = []
+        for i, column in enumerate(columns):
+            seek = column > values[i] if order_direction == "asc" else column < values[i]
+            conditions.append(and_(*[columns[j] == values[j] for j in range(i)], seek))
+        stmt = stmt.where(or_(*conditions))
+
+    ordering = asc if order_direction == "asc" else desc
+    return stmt.order_by(*[ordering(column) for column in columns]).limit(bindparam('keyset_limit'))
+
+def keyset_params(
+        model_class,
+        limit: int,
+        order_by: str = 'id',
+        order_direction: Literal["asc", "desc"] = "asc",
+        cursor: Optional[str] = None,
+) -> dict:
+    """
+    Parameters of a keyset_statement(), after_cursor when cursor is given.
+    One extra row is fetched to know whether there is a next page (see build_page).
+    """
+    params = {'keyset_limit': limit + 1}
+    if cursor:
+        columns = _keyset_columns(model_class, order_by)
+        for i, value in enumerate(decode_cursor(cursor, order_by, order_direction, columns)):
+            params[f'keyset_{i}'] = value
+    return params
+
+def build_page(rows: list, model_class, limit: int, order_by: str = 'id', order_direction: str = "asc") -> Page:
+    """
+    Turn the rows of a keyset_statement() query into a Page.
+    """
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    next_cursor = None
+    if has_more and items:
+        last = items[-1]
+        values = [getattr(last, column.key) for column in _keyset_columns(model_class, order_by)]
+        next_cursor = encode_cursor(order_by, order_direction, values)
+    return Page(items=items, next_cursor=next_cursor, has_more=has_more)
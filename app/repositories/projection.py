@@ -0,0 +1,46 @@
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import inspect
+
+@lru_cache(maxsize=None)
+def _projected_keys(model_class, projection) -> Optional[Tuple[str, ...]]:
+    if isinstance(projection, type) and hasattr(projection, 'model_fields'):
+        fields = projection.model_fields
+        # Aliased fields are looked up under another name: load full entities for those schemas
+        if any(field.alias not in (None, name) for name, field in fields.items()):
+            return None
+        keys = tuple(fields)
+    else:
+        keys = tuple(projection)
+
+    column_keys = set(inspect(model_class).column_attrs.keys())
+    # A field that is not a column (relationship, property...) needs the full entity
+    if not keys or any(key not in column_keys for key in keys):
+        return None
+    return keys
+
+def projection_keys(model_class, projection, required: Iterable[str] = ()) -> Optional[Tuple[str, ...]]:
+    """
+    Names of the columns to select instead of the full entity.
+    Rows of such a select are plain Row tuples with attribute access: no identity map, no ORM state,
+    and they validate directly into a from_attributes response schema.
+    :param projection: pydantic model class (its field names are used) or an iterable of column names
+    :param required: column names selected in addition (e.g. the keyset pagination columns)
+    :return: the column names, or None when the projection cannot be served from columns alone
+    """
+    if projection is None:
+        return None
+    keys = _projected_keys(model_class, projection if isinstance(projection, type) else tuple(projection))
+    if keys is None:
+        return None
+    return keys + tuple(key for key in required if key not in keys)
+
+def projection_columns(model_class, projection, required: Iterable[str] = ()) -> Optional[list]:
+    """
+    Same as projection_keys(), returning the column attributes.
+    """
+    keys = projection_keys(model_class, projection, required)
+    if keys is None:
+        return None
+    return [getattr(model_class, key) for key in keys]
@@ -0,0 +1,253 @@
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.util import find_tables
+
+CACHE_MISS = object()
+
+_PENDING_KEY = 'fastie_query_cache_pending'
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+def _estimate_size(rows: list) -> int:
+    """
+    Rough memory footprint of cached rows: the containers plus every value.
+    """
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        for value in row:
+            size += sys.getsizeof(value)
+    return size
+
+class QueryCache:
+    """
+    Process-wide cache of query results, keyed by compiled SQL and bound parameters.
+    Every entry is tagged with the tables it reads. A write to one of those tables (repository bulk
+    statement, flush, or any INSERT/UPDATE/DELETE run through a Session) drops the entries and bumps
+    the table version, so a query that started before the write never stores its stale result.
+    Only immutable Row results (projected queries) are cached: they are shared safely between sessions.
+    """
+    def __init__(self, enabled: bool = True, max_entries: int = 1000, max_bytes: int = 64 * 1024 * 1024, ttl: float = 60.0):
+        """
+        :param enabled: kill switch, a disabled cache executes every query
+        :param max_entries: maximum number of cached results
+        :param max_bytes: approximate memory bound of all cached results
+        :param ttl: seconds a result is served
+        """
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: 'OrderedDict[Any, tuple]' = OrderedDict()  # key -> (expires_at, tables, size, rows)
+        self._by_table: Dict[str, Set[Any]] = {}
+        self._versions: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._compiled_statements: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        """
+        Turn the cache off and drop every entry.
+        """
+        self.enabled = False
+        self.clear()
+
+    @staticmethod
+    def statement_tables(stmt) -> Tuple[str, ...]:
+        return tuple(sorted({table.name for table in find_tables(stmt, include_aliases=True) if hasattr(table, 'name')}))
+
+    def _compiled(self, stmt, dialect) -> tuple:
+        """
+        SQL, literal parameters and tables of a statement, compiled once per statement object
+        (repository statements are built once per query shape, see statements.py).
+        """
+        per_dialect = self._compiled_statements.get(stmt)
+        if per_dialect is None:
+            per_dialect = self._compiled_statements.setdefault(stmt, {})
+        compiled = per_dialect.get(dialect.name)
+        if compiled is None:
+            result = stmt.compile(dialect=dialect)
+            compiled = per_dialect[dialect.name] = (str(result), dict(result.params), self.statement_tables(stmt))
+        return compiled
+
+    def statement_key(self, stmt, dialect, params: Optional[dict] = None) -> Any:
+        sql, literal_params, _ = self._compiled(stmt, dialect)
+        merged = dict(literal_params, **params) if params else literal_params
+        return sql, tuple(
+            (name, tuple(value) if isinstance(value, list) else value) for name, value in sorted(merged.items())
+        )
+
+    def lookup(self, stmt, dialect, params: Optional[dict] = None):
+        """
+        :param params: execution parameters of the statement
+        :return: (key, tables, versions, rows) where rows is CACHE_MISS on a miss;
+                 pass the first three to store() with the fetched rows
+        """
+        key = self.statement_key(stmt, dialect, params)
+        tables = self._compiled(stmt, dialect)[2]
+        with self._lock:
+            versions = tuple(self._versions.get(table, 0) for table in tables)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return key, tables, versions, list(entry[3])
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+        return key, tables, versions, CACHE_MISS
+
+    def store(self, key, tables: Tuple[str, ...], versions: Tuple[int, ...], rows: list):
+        size = _estimate_size(rows)
+        # A single result may not take more than a tenth of the budget
+        if size > self.max_bytes // 10:
+            return
+        with self._lock:
+            if not self.enabled:
+                return
+            # A table was written while the query ran: its result may already be stale
+            if versions != tuple(self._versions.get(table, 0) for table in tables):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, tables, size, tuple(rows))
+            self._bytes += size
+            for table in tables:
+                self._by_table.setdefault(table, set()).add(key)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, tables, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        for table in tables:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+
+    def invalidate_tables(self, tables: Iterable[str]):
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+                for key in list(self._by_table.pop(table, ())):
+                    if key in self._entries:
+                        self._remove(key)
+                        self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._by_table.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+_query_cache: Optional[QueryCache] = None
+_query_cache_lock = threading.Lock()
+
+# Every cache invalidated by table writes: the query cache, the count cache...
+_caches: List[QueryCache] = []
+
+def register_query_cache(cache: QueryCache):
+    with _query_cache_lock:
+        _caches.append(cache)
+
+def _invalidate_tables(tables: Iterable[str]):
+    for cache in _caches:
+        cache.invalidate_tables(tables)
+
+def get_query_cache() -> QueryCache:
+    """
+    The process-wide query cache, configured from the environment:
+    FASTIE_QUERY_CACHE (kill switch, default on), FASTIE_QUERY_CACHE_MAX_ENTRIES,
+    FASTIE_QUERY_CACHE_MAX_BYTES and FASTIE_QUERY_CACHE_TTL.
+    """
+    global _query_cache
+    if _query_cache is None:
+        with _query_cache_lock:
+            if _query_cache is None:
+                cache = QueryCache(
+                    enabled=_env_flag("FASTIE_QUERY_CACHE", True),
+                    max_entries=int(os.getenv("FASTIE_QUERY_CACHE_MAX_ENTRIES") or 1000),
+                    max_bytes=int(os.getenv("FASTIE_QUERY_CACHE_MAX_BYTES") or 64 * 1024 * 1024),
+                    ttl=float(os.getenv("FASTIE_QUERY_CACHE_TTL") or 60.0),
+                )
+                _caches.append(cache)
+                _query_cache = cache
+    return _query_cache
+
+def has_pending_table_writes(session: Session) -> bool:
+    """
+    A session with uncommitted writes bypasses the query cache: it must see its own changes.
+    """
+    return bool(session.info.get(_PENDING_KEY))
+
+def record_table_writes(session: Session, tables: Iterable[str]):
+    """
+    Invalidate the results reading tables, now and again when the session commits.
+    """
+    tables = set(tables)
+    if not tables:
+        return
+    _invalidate_tables(tables)
+    session.info.setdefault(_PENDING_KEY, set()).update(tables)
+
+@event.listens_for(Session, 'after_flush')
+def _after_flush(session, flush_context):
+    tables = set()
+    for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+        tables.update(table.name for table in inspect(instance).mapper.tables)
+    record_table_writes(session, tables)
+
+@event.listens_for(Session, 'do_orm_execute')
+def _on_execute(orm_execute_state):
+    # Bulk INSERT/UPDATE/DELETE statements do not go through the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, 'table', None)
+        if table is not None and hasattr(table, 'name'):
+            record_table_writes(orm_execute_state.session, [table.name])
+
+@event.listens_for(Session, 'after_commit')
+def _after_commit(session):
+    tables = session.info.pop(_PENDING_KEY, None)
+    if tables:
+        _invalidate_tables(tables)
+
+@event.listens_for(Session, 'after_rollback')
+def _after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
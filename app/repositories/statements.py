@@ -0,0 +1,94 @@
+from typing import Callable, Dict, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import asc, bindparam, desc, func, select
+from sqlalchemy.orm import joinedload
+
+from app.repositories.pagination import keyset_statement
+
+S = TypeVar('S')
+
+# Statements built once per model and query shape, executed with bound parameters.
+# SQLAlchemy caches the compiled SQL by statement structure: with the construction (getattr, joinedload options,
+# Query -> select conversion) also done once, a call only binds its parameters.
+_statements: Dict[tuple, object] = {}
+
+def cached_statement(key: tuple, build: Callable[[], S]) -> S:
+    """
+    :param key: model class and every option changing the SQL (never a parameter value)
+    :param build: builds the statement on the first call for key
+    """
+    stmt = _statements.get(key)
+    if stmt is None:
+        # Two threads may build the same statement: both are equivalent, the first one stored is kept
+        stmt = _statements.setdefault(key, build())
+    return stmt
+
+def _base_select(model_class, columns: Optional[Sequence[str]], eager_relations: Tuple[str, ...], with_trash: bool):
+    if columns:
+        stmt = select(*[getattr(model_class, key) for key in columns])
+    else:
+        stmt = select(model_class)
+        for relation in eager_relations:
+            stmt = stmt.options(joinedload(getattr(model_class, relation)))
+    if not with_trash and hasattr(model_class, 'deleted_at'):
+        stmt = stmt.where(model_class.deleted_at.is_(None))
+    return stmt
+
+def by_id_statement(model_class, with_trash: bool = False, eager_relations: Tuple[str, ...] = ()):
+    """
+    SELECT of one row by primary key, parameter: id.
+    """
+    def build():
+        return _base_select(model_class, None, eager_relations, with_trash).where(model_class.id == bindparam('id'))
+
+    return cached_statement(('by_id', model_class, with_trash, eager_relations), build)
+
+def list_statement(
+        model_class,
+        columns: Optional[Tuple[str, ...]] = None,
+        eager_relations: Tuple[str, ...] = (),
+        with_trash: bool = False,
+        order_by: Optional[str] = None,
+        order_direction: str = "asc",
+):
+    """
+    SELECT of a slice of rows, parameters: skip, limit.
+    :param columns: column names of a projection, None to select entities
+    """
+    def build():
+        stmt = _base_select(model_class, columns, eager_relations, with_trash)
+        if order_by:
+            column = getattr(model_class, order_by)
+            stmt = stmt.order_by(desc(column) if order_direction == "desc" else asc(column))
+        return stmt.offset(bindparam('skip')).limit(bindparam('limit'))
+
+    key = ('list', model_class, columns, eager_relations, with_trash, order_by, order_direction)
+    return cached_statement(key, build)
+
+def page_statement(
+        model_class,
+        columns: Optional[Tuple[str, ...]] = None,
+        eager_relations: Tuple[str, ...] = (),
+        with_trash: bool = False,
+        order_by: str = "id",
+        order_direction: str = "asc",
+        after_cursor: bool = False,
+):
+    """
+    Keyset page SELECT, parameters: see pagination.keyset_params().
+    """
+    def build():
+        stmt = _base_select(model_class, columns, eager_relations, with_trash)
+        return keyset_statement(stmt, model_class, order_by, order_direction, after_cursor)
+
+    key = ('page', model_class, columns, eager_relations, with_trash, order_by, order_direction, after_cursor)
+    return cached_statement(key, build)
+
+def count_statement(model_class, with_trash: bool = False):
+    def build():
+        stmt = select(func.count()).select_from(model_class)
+        if not with_trash and hasattr(model_class, 'deleted_at'):
+            stmt = stmt.where(model_class.deleted_at.is_(None))
+        return stmt
+
+    return cached_statement(('count', model_class, with_trash), build)
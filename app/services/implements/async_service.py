@@ -0,0 +1,145 @@
+from typing import TypeVar, Generic, Optional, List, Literal, AsyncIterator, Union
+
+from pydantic import BaseModel
+
+from app.core.exceptions.repository_exception import RepositoryException
+from app.infrastructures.database.db_context import AsyncDbContext, StreamingAsyncDbContext
+from app.repositories.counting import CountMode
+from app.repositories.interfaces.i_async_repository import IAsyncRepository
+from app.repositories.pagination import Page
+from app.services.interfaces.i_async_service import IAsyncService
+
+T = TypeVar('T')
+TCreate = TypeVar('TCreate')
+TUpdate = TypeVar('TUpdate')
+TResponse = TypeVar('TResponse', bound=BaseModel)
+
+class AsyncService(IAsyncService[T, TCreate, TUpdate, TResponse], Generic[T, TCreate, TUpdate, TResponse]):
+    """
+    Async counterpart of Service: same CRUD surface, awaited on an AsyncSession.
+    """
+    def __init__(self, repository: IAsyncRepository[T, TCreate, TUpdate], response_model: Optional[BaseModel] = None):
+        self.repository = repository
+        self.response_model = response_model
+
+    async def get_all(
+            self,
+            skip: int = 0,
+            limit: int = 100,
+            order_by: Optional[str] = None,
+            order_direction: Literal["asc", "desc"] = "asc",
+            total: Optional[CountMode] = None
+    ) -> Union[List[TResponse], Page[TResponse]]:
+        try:
+            async with AsyncDbContext():
+                if order_by is not None and order_direction not in ["asc", "desc"]:
+                    raise ValueError("order_direction must be 'asc' or 'desc'")
+
+                items = await self.repository.get_all(
+                    skip, limit, order_by, order_direction, projection=self.response_model, total=total
+                )
+                if isinstance(items, Page):
+                    return items.map(self.response_model.model_validate)
+                return [self.response_model.model_validate(item) for item in items]
+        except Exception as e:
+            raise RepositoryException('Error retrieving records: ' + str(e))
+
+    async def get_page(
+            self,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+            order_by: str = "id",
+            order_direction: Literal["asc", "desc"] = "asc",
+            total: Optional[CountMode] = None
+    ) -> Page[TResponse]:
+        try:
+            async with AsyncDbContext():
+                page = await self.repository.get_page(
+                    limit, cursor, order_by, order_direction, projection=self.response_model, total=total
+                )
+                return page.map(self.response_model.model_validate)
+        except Exception as e:
+            raise RepositoryException('Error retrieving records: ' + str(e))
+
+    async def stream(self, batch_size: int = 1000) -> AsyncIterator[TResponse]:
+        try:
+            # Own session: a streamed response is still being read after the request unit of work completed
+            async with StreamingAsyncDbContext() as db_context:
+                items = self.repository.stream(batch_size, projection=self.response_model)
+                try:
+                    while True:
+                        # Each step may run in another context, the session is bound for the step only
+                        with db_context.bound():
+                            item = await anext(items, None)
+                        if item is None:
+                            break
+                        yield self.response_model.model_validate(item)
+                finally:
+                    await items.aclose()
+        except Exception as e:
+            raise RepositoryException('Error streaming records: ' + str(e))
+
+    async def get_by_id(self, id: int) -> Optional[TResponse]:
+        try:
+            async with AsyncDbContext():
+                return self.response_model.model_validate(await self.repository.get_by_id(id))
+        except Exception as e:
+            raise RepositoryException('Error retrieving record by ID: ' + str(e))
+
+    async def create(self, data: TCreate) -> TResponse:
+        try:
+            async with AsyncDbContext():
+                return self.response_model.model_validate(await self.repository.create(data))
+        except Exception as e:
+            raise RepositoryException('Error creating record: ' + str(e))
+
+    async def update(self, id: int, data: TUpdate) -> TResponse:
+        try:
+            async with AsyncDbContext():
+                return self.response_model.model_validate(await self.repository.update(id, data))
+        except Exception as e:
+            raise RepositoryException('Error updating record: ' + str(e))
+
+    async def delete(self, id: int) -> None:
+        try:
+            async with AsyncDbContext():
+                return await self.repository.delete(id)
+        except Exception as e:
+            raise RepositoryException('Error deleting record: ' + str(e))
+
+    async def force_delete(self, id: int) -> None:
+        try:
+            async with AsyncDbContext():
+                return await self.repository.force_delete(id)
+        except Exception as e:
+            raise RepositoryException('Error deleting record: ' + str(e))
+
+    async def create_many(self, items: List[TCreate]) -> List[TResponse]:
+        try:
+            async with AsyncDbContext():
+                return [self.response_model.model_validate(item) for item in await self.repository.create_many(items)]
+        except Exception as e:
+            raise RepositoryException('Error creating records: ' + str(e))
+
+    async def update_many(self, data, ids: Optional[List[int]] = None) -> int:
+        try:
+            if not isinstance(data, list) and ids is None:
+                raise ValueError("ids are required unless data is a list of rows with ids")
+            async with AsyncDbContext():
+                return await self.repository.update_many(data, ids)
+        except Exception as e:
+            raise RepositoryException('Error updating records: ' + str(e))
+
+    async def delete_many(self, ids: List[int]) -> int:
+        try:
+            async with AsyncDbContext():
+                return await self.repository.delete_many(ids)
+        except Exception as e:
+            raise RepositoryException('Error deleting records: ' + str(e))
+
+    async def force_delete_many(self, ids: List[int]) -> int:
+        try:
+            async with AsyncDbContext():
+                return await self.repository.force_delete_many(ids)
+        except Exception as e:
+            raise RepositoryException('Error deleting records: ' + str(e))
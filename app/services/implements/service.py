@@ -1,10 +1,12 @@
-from typing import TypeVar, Generic, Optional, List, Literal
+from typing import TypeVar, Generic, Optional, List, Literal, Iterator, Union
 
 from pydantic import BaseModel
 
 from app.core.exceptions.repository_exception import RepositoryException
-from app.infrastructures.database.db_context import DbContext
+from app.infrastructures.database.db_context import DbContext, StreamingDbContext
+from app.repositories.counting import CountMode
 from app.repositories.interfaces.i_repository import IRepository
+from app.repositories.pagination import Page
 from app.services.interfaces.i_service import IService
 
 T = TypeVar('T')
@@ -22,57 +24,121 @@ class Service(IService[T, TCreate, TUpdate, TResponse], Generic[T, TCreate, TUpd
             skip: int = 0,
             limit: int = 100,
             order_by: Optional[str] = None,
-            order_direction: Literal["asc", "desc"] = "asc"
-    ) -> List[T]:
+            order_direction: Literal["asc", "desc"] = "asc",
+            total: Optional[CountMode] = None
+    ) -> Union[List[T], Page[T]]:
         try:
-            with DbContext() as db_context:
-                self.repository.set_session(db_context.session)
+            with DbContext():
                 # Call the repository method to get all records
                 if order_by is not None and order_direction not in ["asc", "desc"]:
                     raise ValueError("order_direction must be 'asc' or 'desc'")
 
                 # Return the result from the repository
-                items = self.repository.get_all(skip, limit, order_by, order_direction)
+                items = self.repository.get_all(
+                    skip, limit, order_by, order_direction, projection=self.response_model, total=total
+                )
+                if isinstance(items, Page):
+                    return items.map(self.response_model.model_validate)
                 return [self.response_model.model_validate(item) for item in items]
         except Exception as e:
             raise RepositoryException('Error retrieving records: ' + str(e))
 
+    def get_page(
+            self,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+            order_by: str = "id",
+            order_direction: Literal["asc", "desc"] = "asc",
+            total: Optional[CountMode] = None
+    ) -> Page[T]:
+        try:
+            with DbContext():
+                page = self.repository.get_page(
+                    limit, cursor, order_by, order_direction, projection=self.response_model, total=total
+                )
+                return page.map(self.response_model.model_validate)
+        except Exception as e:
+            raise RepositoryException('Error retrieving records: ' + str(e))
+
+    def stream(self, batch_size: int = 1000) -> Iterator[T]:
+        try:
+            # Own session: a streamed response is still being read after the request unit of work completed
+            with StreamingDbContext() as db_context:
+                items = self.repository.stream(batch_size, projection=self.response_model)
+                try:
+                    while True:
+                        # Each step may run in another context, the session is bound for the step only
+                        with db_context.bound():
+                            item = next(items, None)
+                        if item is None:
+                            break
+                        yield self.response_model.model_validate(item)
+                finally:
+                    items.close()
+        except Exception as e:
+            raise RepositoryException('Error streaming records: ' + str(e))
+
     def get_by_id(self, id: int) -> Optional[T]:
         try:
-            with DbContext() as db_context:
-                self.repository.set_session(db_context.session)
+            with DbContext():
                 return self.response_model.model_validate(self.repository.get_by_id(id))
         except Exception as e:
             raise RepositoryException('Error retrieving record by ID: ' + str(e))
 
     def create(self, data: TCreate) -> T:
         try:
-            with DbContext() as db_context:
-                self.repository.set_session(db_context.session)
+            with DbContext():
                 return self.response_model.model_validate(self.repository.create(data))
         except Exception as e:
             raise RepositoryException('Error creating record: ' + str(e))
 
     def update(self, id: int, data: TUpdate) -> T:
         try:
-            with DbContext() as db_context:
-                self.repository.set_session(db_context.session)
+            with DbContext():
                 return self.response_model.model_validate(self.repository.update(id, data))
         except Exception as e:
             raise RepositoryException('Error updating record: ' + str(e))
 
     def delete(self, id: int) -> None:
         try:
-            with DbContext() as db_context:
-                self.repository.set_session(db_context.session)
+            with DbContext():
                 return self.repository.delete(id)
         except Exception as e:
             raise RepositoryException('Error deleting record: ' + str(e))
 
     def force_delete(self, id: int) -> None:
         try:
-            with DbContext() as db_context:
-                self.repository.set_session(db_context.session)
+            with DbContext():
                 return self.repository.force_delete(id)
         except Exception as e:
-            raise RepositoryException('Error deleting record: ' + str(e))
\ No newline at end of file
+            raise RepositoryException('Error deleting record: ' + str(e))
+
+    def create_many(self, items: List[TCreate]) -> List[T]:
+        try:
+            with DbContext():
+                return [self.response_model.model_validate(item) for item in self.repository.create_many(items)]
+        except Exception as e:
+            raise RepositoryException('Error creating records: ' + str(e))
+
+    def update_many(self, data, ids: Optional[List[int]] = None) -> int:
+        try:
+            if not isinstance(data, list) and ids is None:
+                raise ValueError("ids are required unless data is a list of rows with ids")
+            with DbContext():
+                return self.repository.update_many(data, ids)
+        except Exception as e:
+            raise RepositoryException('Error updating records: ' + str(e))
+
+    def delete_many(self, ids: List[int]) -> int:
+        try:
+            with DbContext():
+                return self.repository.delete_many(ids)
+        except Exception as e:
+            raise RepositoryException('Error deleting records: ' + str(e))
+
+    def force_delete_many(self, ids: List[int]) -> int:
+        try:
+            with DbContext():
+                return self.repository.force_delete_many(ids)
+        except Exception as e:
+            raise RepositoryException('Error deleting records: ' + str(e))
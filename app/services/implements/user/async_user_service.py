@@ -0,0 +1,10 @@
+from app.core.decorators.di import service
+from app.repositories.interfaces.user.i_async_user_repository import IAsyncUserRepository
+from app.schemas.responses.user.user_response_schema import UserResponseSchema
+from app.services.implements.async_service import AsyncService
+from app.services.interfaces.user.i_async_user_service import IAsyncUserService
+
+@service
+class AsyncUserService(AsyncService, IAsyncUserService):
+    def __init__(self, repository: IAsyncUserRepository):
+        super().__init__(repository, UserResponseSchema)
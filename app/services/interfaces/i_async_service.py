@@ -0,0 +1,99 @@
+from abc import ABC, abstractmethod
+from typing import TypeVar, Generic, Optional, List, Literal, AsyncIterator, Union
+
+from app.repositories.counting import CountMode
+from app.repositories.pagination import Page
+
+T = TypeVar("T")
+TCreate = TypeVar("TCreate")
+TUpdate = TypeVar("TUpdate")
+TResponse = TypeVar("TResponse")
+
+class IAsyncService(ABC, Generic[T, TCreate, TUpdate, TResponse]):
+    @abstractmethod
+    async def get_all(
+            self,
+            skip: int = 0,
+            limit: int = 100,
+            order_by: Optional[str] = None,
+            order_direction: Literal["asc", "desc"] = "asc",
+            total: Optional[CountMode] = None
+    ) -> Union[List[TResponse], Page[TResponse]]:
+        """
+        Retrieve all records with optional pagination and sorting.
+        :param total: exact or estimated to return a Page with the total count and has_more instead of a list
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(
+            self,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+            order_by: str = "id",
+            order_direction: Literal["asc", "desc"] = "asc",
+            total: Optional[CountMode] = None
+    ) -> Page[TResponse]:
+        """
+        Retrieve one page of records with keyset (cursor) pagination.
+        :param cursor: next_cursor of the previous page, None for the first page
+        :param order_by: non nullable column to order by, the id is used as tie-breaker
+        :param total: exact or estimated to also return the total count (cached, see IRepository.count)
+        """
+        pass
+
+    @abstractmethod
+    def stream(self, batch_size: int = 1000) -> AsyncIterator[TResponse]:
+        """
+        Iterate over every record as response models, validated lazily one at a time.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, id: int) -> Optional[TResponse]:
+        """Retrieve a single record by ID."""
+        pass
+
+    @abstractmethod
+    async def create(self, data: TCreate) -> TResponse:
+        """Create a new record."""
+        pass
+
+    @abstractmethod
+    async def update(self, id: int, data: TUpdate) -> TResponse:
+        """Update an existing record by ID."""
+        pass
+
+    @abstractmethod
+    async def delete(self, id: int) -> None:
+        """Delete a record by ID. (Soft delete)"""
+        pass
+
+    @abstractmethod
+    async def force_delete(self, id: int) -> None:
+        """Delete a record by ID."""
+        pass
+
+    @abstractmethod
+    async def create_many(self, items: List[TCreate]) -> List[TResponse]:
+        """Create many records at once."""
+        pass
+
+    @abstractmethod
+    async def update_many(self, data, ids: Optional[List[int]] = None) -> int:
+        """
+        Update many records at once.
+        :param data: values applied to every row in ids, or a list of per-row values each containing the id
+        :return: number of updated rows
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(self, ids: List[int]) -> int:
+        """Soft delete many records by ID."""
+        pass
+
+    @abstractmethod
+    async def force_delete_many(self, ids: List[int]) -> int:
+        """Delete many records by ID."""
+        pass
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Optional, List, Literal
+from typing import TypeVar, Generic, Optional, List, Literal, Iterator, Union
+
+from app.repositories.counting import CountMode
+from app.repositories.pagination import Page
 
 T = TypeVar("T")
 TCreate = TypeVar("TCreate")
@@ -13,10 +16,36 @@ class IService(ABC, Generic[T, TCreate, TUpdate, TResponse]):
             skip: int = 0,
             limit: int = 100,
             order_by: Optional[str] = None,
-            order_direction: Literal["asc", "desc"] = "asc"
-    ) -> List[T]:
+            order_direction: Literal["asc", "desc"] = "asc",
+            total: Optional[CountMode] = None
+    ) -> Union[List[T], Page[T]]:
         """
         Retrieve all records with optional pagination and sorting.
+        :param total: exact or estimated to return a Page with the total count and has_more instead of a list
+        """
+        pass
+
+    @abstractmethod
+    def get_page(
+            self,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+            order_by: str = "id",
+            order_direction: Literal["asc", "desc"] = "asc",
+            total: Optional[CountMode] = None
+    ) -> Page[T]:
+        """
+        Retrieve one page of records with keyset (cursor) pagination.
+        :param cursor: next_cursor of the previous page, None for the first page
+        :param order_by: non nullable column to order by, the id is used as tie-breaker
+        :param total: exact or estimated to also return the total count (cached, see IRepository.count)
+        """
+        pass
+
+    @abstractmethod
+    def stream(self, batch_size: int = 1000) -> Iterator[T]:
+        """
+        Iterate over every record as response models, validated lazily one at a time.
         """
         pass
 
@@ -44,3 +73,27 @@ class IService(ABC, Generic[T, TCreate, TUpdate, TResponse]):
     def force_delete(self, id: int) -> None:
         """Delete a record by ID."""
         pass
+
+    @abstractmethod
+    def create_many(self, items: List[TCreate]) -> List[T]:
+        """Create many records at once."""
+        pass
+
+    @abstractmethod
+    def update_many(self, data, ids: Optional[List[int]] = None) -> int:
+        """
+        Update many records at once.
+        :param data: values applied to every row in ids, or a list of per-row values each containing the id
+        :return: number of updated rows
+        """
+        pass
+
+    @abstractmethod
+    def delete_many(self, ids: List[int]) -> int:
+        """Soft delete many records by ID."""
+        pass
+
+    @abstractmethod
+    def force_delete_many(self, ids: List[int]) -> int:
+        """Delete many records by ID."""
+        pass
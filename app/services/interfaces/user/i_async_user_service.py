@@ -0,0 +1,11 @@
+from abc import ABC
+
+from app.models.user import User
+from app.schemas.models.user.user_create_schema import UserCreateSchema
+from app.schemas.responses.user.user_response_schema import UserResponseSchema
+from app.schemas.models.user.user_update_schema import UserUpdateSchema
+from app.services.interfaces.i_async_service import IAsyncService
+
+
+class IAsyncUserService(IAsyncService[User, UserCreateSchema, UserUpdateSchema, UserResponseSchema], ABC):
+    pass
@@ -0,0 +1,91 @@
+"""
+Microbenchmark of Repository.get_by_id per-call overhead: the previous implementation, building a
+session.query() chain on every call, compared to the cached select() statement executed with a bound id.
+Both run on the same session against an in-memory SQLite database, so the time is mostly Python overhead.
+
+Usage:
+    python benchmarks/get_by_id_benchmark.py [--number 20000] [--users 1000]
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = "sqlite://"
+    # A single connection: the in-memory database lives as long as it
+    os.environ.setdefault("DB_POOL_SIZE", "1")
+
+from sqlalchemy.orm import joinedload
+
+from app.main import app  # noqa: F401  bootstraps the components
+import app.models  # noqa: F401
+from app.core.service_containers.service_containers import get_registry
+from app.infrastructures.database import Base
+from app.infrastructures.database.database_infrastructure import DatabaseInfrastructure
+from app.infrastructures.database.db_context import DbContext
+from app.models.user import User
+from app.repositories.interfaces.user.i_user_repository import IUserRepository
+
+
+def legacy_get_by_id(session, model_class, id, with_trash=False, eager_relations=None):
+    """
+    get_by_id as it was before the statement cache.
+    """
+    query = session.query(model_class).filter(model_class.id == id)
+
+    if eager_relations:
+        for relation in eager_relations:
+            query = query.options(joinedload(getattr(model_class, relation)))
+
+    if not with_trash and hasattr(model_class, 'deleted_at'):
+        query = query.filter(model_class.deleted_at.is_(None))
+
+    return query.first()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=1000)
+    args = parser.parse_args()
+
+    database = get_registry().resolve(DatabaseInfrastructure)
+    Base.metadata.create_all(database.engine)
+    repository = get_registry().resolve(IUserRepository)
+    ids = [random.randint(1, args.users) for _ in range(args.number)]
+
+    with DbContext() as db_context:
+        session = db_context.session
+        session.add_all(
+            User(id=i, name=f"user{i}", email=f"user{i}@example.com", password="x") for i in range(1, args.users + 1)
+        )
+        session.flush()
+
+        def run_legacy():
+            for id in ids:
+                legacy_get_by_id(session, User, id)
+
+        def run_cached():
+            for id in ids:
+                repository.get_by_id(id)
+
+        # Warm up: both shapes compiled once, rows in the identity map
+        run_legacy()
+        run_cached()
+        legacy = min(timeit.repeat(run_legacy, number=1, repeat=5))
+        cached = min(timeit.repeat(run_cached, number=1, repeat=5))
+        session.rollback()
+
+    print(f"{'case':<32} {'us/call':>10}")
+    print(f"{'session.query() chain (before)':<32} {legacy / args.number * 1e6:>10.1f}")
+    print(f"{'cached select() (after)':<32} {cached / args.number * 1e6:>10.1f}")
+    print(f"{'speedup':<32} {legacy / cached:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Microbenchmark of @inject construction cost: the previous reflective wrapper (signature and type hints
+inspected, dependencies resolved on every construction) compared to the compiled injector,
+with a plain constructor call as the baseline.
+
+Usage:
+    python benchmarks/inject_benchmark.py [--number 200000]
+"""
+import argparse
+import inspect
+import sys
+import timeit
+from functools import wraps
+from pathlib import Path
+from typing import get_type_hints
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.decorators.di import inject
+from app.core.service_containers.service_containers import get_registry
+
+
+def legacy_inject(cls):
+    """
+    @inject as it was before the compiled injector.
+    """
+    original_init = cls.__init__
+
+    @wraps(original_init)
+    def new_init(self, *args, **kwargs):
+        if args or kwargs:
+            original_init(self, *args, **kwargs)
+            return
+
+        signature = inspect.signature(original_init)
+        type_hints = get_type_hints(original_init)
+        injected_kwargs = {}
+
+        for name, param in signature.parameters.items():
+            if name == 'self':
+                continue
+
+            param_type = type_hints.get(name)
+            if not param_type:
+                if param.default != inspect.Parameter.empty:
+                    continue
+                raise ValueError(f"Missing type hint for parameter '{name}' in class {cls.__name__}")
+
+            dependency = get_registry().resolve(param_type)
+            injected_kwargs[name] = dependency
+            setattr(self, name, dependency)
+
+        original_init(self, **injected_kwargs)
+
+    cls.__init__ = new_init
+    return cls
+
+
+class Database:
+    pass
+
+
+class Cache:
+    pass
+
+
+class PlainContext:
+    def __init__(self, database: Database, cache: Cache):
+        self.database = database
+        self.cache = cache
+        self.session = None
+
+
+@legacy_inject
+class LegacyInjectedContext:
+    def __init__(self, database: Database, cache: Cache):
+        self.database = database
+        self.cache = cache
+        self.session = None
+
+
+@inject
+class InjectedContext:
+    def __init__(self, database: Database, cache: Cache):
+        self.database = database
+        self.cache = cache
+        self.session = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    registry = get_registry()
+    database, cache = Database(), Cache()
+    registry.register(Database, database)
+    registry.register(Cache, cache)
+
+    InjectedContext()  # warm up (compiles the injector)
+
+    namespace = {
+        "PlainContext": PlainContext,
+        "LegacyInjectedContext": LegacyInjectedContext,
+        "InjectedContext": InjectedContext,
+        "database": database,
+        "cache": cache,
+    }
+    plain = min(timeit.repeat("PlainContext(database, cache)", globals=namespace, number=args.number, repeat=5))
+    legacy = min(timeit.repeat("LegacyInjectedContext()", globals=namespace, number=args.number, repeat=5))
+    injected = min(timeit.repeat("InjectedContext()", globals=namespace, number=args.number, repeat=5))
+
+    print(f"{'case':<32} {'ns/call':>10}")
+    print(f"{'plain constructor':<32} {plain / args.number * 1e9:>10.0f}")
+    print(f"{'reflective @inject (before)':<32} {legacy / args.number * 1e9:>10.0f}")
+    print(f"{'compiled @inject (after)':<32} {injected / args.number * 1e9:>10.0f}")
+    print(f"{'speedup':<32} {legacy / injected:>9.2f}x")
+    print(f"{'overhead vs plain (after)':<32} {injected / plain:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Stress test of the singleton repositories under concurrency: many threads (sync UserRepository)
+and many tasks (AsyncUserRepository) query through the same instance at once, and every operation
+checks that it only ever saw its own session and its own rows.
+Exits with status 1 if any cross-talk is detected.
+
+Usage:
+    python benchmarks/repository_concurrency_stress.py [--workers 64] [--operations 5000] [--users 200]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/stress.db"
+
+from sqlalchemy.orm import object_session
+
+from app.main import app  # noqa: F401  bootstraps the components
+import app.models  # noqa: F401
+from app.core.service_containers.service_containers import get_registry
+from app.infrastructures.database import Base
+from app.infrastructures.database.database_infrastructure import DatabaseInfrastructure
+from app.infrastructures.database.db_context import DbContext, AsyncDbContext
+from app.models.user import User
+from app.repositories.interfaces.user.i_async_user_repository import IAsyncUserRepository
+from app.repositories.interfaces.user.i_user_repository import IUserRepository
+
+
+def seed(database: DatabaseInfrastructure, users: int):
+    Base.metadata.create_all(database.engine)
+    with DbContext() as db_context:
+        db_context.session.query(User).delete()
+        db_context.session.add_all(
+            User(id=i, name=f"user{i}", email=f"user{i}@example.com", password="x") for i in range(1, users + 1)
+        )
+
+
+def sync_operation(repository, user_id: int) -> int:
+    """
+    :return: number of cross-talk errors seen by this operation
+    """
+    errors = 0
+    with DbContext() as db_context:
+        if repository.session is not db_context.session:
+            errors += 1
+        user = repository.get_by_id(user_id)
+        time.sleep(0)  # let other threads run between the query and the checks
+        if repository.session is not db_context.session:
+            errors += 1
+        if user is None or user.id != user_id or object_session(user) is not db_context.session:
+            errors += 1
+    return errors
+
+
+async def async_operation(repository, user_id: int) -> int:
+    errors = 0
+    async with AsyncDbContext() as db_context:
+        if repository.session is not db_context.session:
+            errors += 1
+        user = await repository.get_by_id(user_id)
+        await asyncio.sleep(0)
+        if repository.session is not db_context.session:
+            errors += 1
+        if user is None or user.id != user_id or object_session(user) is not db_context.session.sync_session:
+            errors += 1
+    return errors
+
+
+def run_sync(workers: int, operations: int, users: int):
+    repository = get_registry().resolve(IUserRepository)
+    user_ids = [random.randint(1, users) for _ in range(operations)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        errors = sum(executor.map(lambda user_id: sync_operation(repository, user_id), user_ids))
+    return errors, time.perf_counter() - start
+
+
+async def run_async(workers: int, operations: int, users: int):
+    repository = get_registry().resolve(IAsyncUserRepository)
+    semaphore = asyncio.Semaphore(workers)
+
+    async def bounded(user_id: int) -> int:
+        async with semaphore:
+            return await async_operation(repository, user_id)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(bounded(random.randint(1, users)) for _ in range(operations)))
+    return sum(results), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=64, help="concurrent threads / tasks")
+    parser.add_argument("--operations", type=int, default=5000, help="operations per mode")
+    parser.add_argument("--users", type=int, default=200, help="rows seeded in the users table")
+    args = parser.parse_args()
+
+    database = get_registry().resolve(DatabaseInfrastructure)
+    seed(database, args.users)
+
+    sync_errors, sync_seconds = run_sync(args.workers, args.operations, args.users)
+    print(f"sync  UserRepository      : {args.operations} ops, {args.workers} threads, "
+          f"{sync_seconds:.2f}s, cross-talk errors: {sync_errors}")
+
+    async_errors, async_seconds = asyncio.run(run_async(args.workers, args.operations, args.users))
+    print(f"async AsyncUserRepository : {args.operations} ops, {args.workers} tasks, "
+          f"{async_seconds:.2f}s, cross-talk errors: {async_errors}")
+
+    sys.exit(1 if sync_errors or async_errors else 0)
+
+
+if __name__ == "__main__":
+    main()
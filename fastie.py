@@ -389,8 +389,17 @@ def make_schema(name, schema_type):
 @click.option('--host', default='0.0.0.0', help='Host to bind')
 @click.option('--port', default=8000, help='Port to bind')
 @click.option('--reload', is_flag=True, help='Enable auto-reload')
-def serve(host, port, reload):
-    """Start the development server"""
+@click.option('--workers', '-w', default=1, help='Number of worker processes (production mode when > 1)')
+@click.option('--graceful-timeout', default=30, help='Seconds a worker may take to drain on stop/restart')
+def serve(host, port, reload, workers, graceful_timeout):
+    """Start the server (development, or pre-forked production workers)"""
+    if workers > 1:
+        if reload:
+            click.echo("❌ --reload cannot be combined with --workers")
+            return
+        _serve_production(host, port, workers, graceful_timeout)
+        return
+
     click.echo(f"🚀 Starting Fastie server at http://{host}:{port}")
     
     cmd = ['uvicorn', 'app.main:app', '--host', host, '--port', str(port)]
@@ -403,6 +412,31 @@ def serve(host, port, reload):
         click.echo("\n👋 Server stopped")
 
 
+def _serve_production(host, port, workers, graceful_timeout):
+    """Preload the application once, then fork the workers (copy-on-write)"""
+    if not hasattr(os, 'fork'):
+        # No fork (Windows): fall back to uvicorn's own multi-process mode
+        click.echo(f"🚀 Starting Fastie server at http://{host}:{port} with {workers} workers")
+        cmd = ['uvicorn', 'app.main:app', '--host', host, '--port', str(port), '--workers', str(workers)]
+        try:
+            subprocess.run(cmd)
+        except KeyboardInterrupt:
+            click.echo("\n👋 Server stopped")
+        return
+
+    from app.core.server.prefork_server import PreforkServer
+
+    server = PreforkServer('app.main:app', host=host, port=port, workers=workers, graceful_timeout=graceful_timeout)
+    click.echo(f"🚀 Starting Fastie server at http://{host}:{port} with {workers} pre-forked workers "
+               f"(loop={server.loop}, http={server.http})")
+    click.echo("💡 kill -HUP <master pid> for a rolling restart")
+    exit_code = server.run()
+    if exit_code:
+        click.echo("❌ Workers keep failing to boot, server stopped")
+        sys.exit(exit_code)
+    click.echo("👋 Server stopped")
+
+
 # =============================================================================
 # UTILITY COMMANDS  
 # =============================================================================
@@ -605,6 +639,91 @@ def route_list(path, method, tag, detail):
         click.echo(f"❌ Error inspecting routes: {e}")
 
 
+@cli.command(name='components:cache')
+def components_cache():
+    """Cache the list of modules that define DI components"""
+    click.echo("🔎 Scanning app package for components...")
+    try:
+        from app.core.providers.app_service_providers import build_component_manifest, component_manifest_path
+
+        manifest = build_component_manifest()
+        click.echo(f"✅ Component manifest written: {component_manifest_path()}")
+        click.echo(f"📦 {len(manifest['modules'])} component module(s), {len(manifest['files'])} file(s) tracked")
+    except ImportError as e:
+        click.echo(f"❌ Failed to import application: {e}")
+        click.echo("💡 Make sure you're running this from the project root directory")
+
+
+@cli.command(name='components:clear')
+def components_clear():
+    """Remove the cached component manifest"""
+    try:
+        from app.core.providers.app_service_providers import component_manifest_path
+
+        manifest_path = component_manifest_path()
+        if manifest_path.exists():
+            manifest_path.unlink()
+            click.echo(f"🗑️  Component manifest removed: {manifest_path}")
+        else:
+            click.echo("⚠️  No component manifest found")
+    except ImportError as e:
+        click.echo(f"❌ Failed to import application: {e}")
+
+
+@cli.command(name='profile:startup')
+@click.option('--output', '-o', help='JSON report path (default: storage/cache/startup_profile.json)')
+@click.option('--limit', '-l', default=20, help='Number of rows shown per table')
+def profile_startup(output, limit):
+    """Profile application startup (imports, components, infrastructure)"""
+    click.echo("⏱️  Profiling application startup...")
+    try:
+        import json
+        import time
+
+        start = time.perf_counter()
+        import app.main  # noqa: F401
+        total = time.perf_counter() - start
+
+        from app.core.paths.cache import __cache_path__
+        from app.core.profiling.startup_profiler import build_startup_report
+
+        report = build_startup_report(total)
+
+        sections = [
+            ('modules', 'MODULE IMPORTS (inclusive)'),
+            ('components', 'COMPONENT CONSTRUCTION'),
+            ('infrastructure', 'INFRASTRUCTURE'),
+        ]
+        for key, title in sections:
+            rows = report[key]
+            click.echo("=" * 80)
+            click.echo(f"{title:<66} {'TIME (ms)':>13}")
+            click.echo("-" * 80)
+            for row in rows[:limit]:
+                name = row['name'][:62] + ".." if len(row['name']) > 64 else row['name']
+                click.echo(f"{name:<66} {row['seconds'] * 1000:>13.2f}")
+            if len(rows) > limit:
+                click.echo(f"... {len(rows) - limit} more")
+
+        click.echo("=" * 80)
+        click.echo("DEPENDENCY GRAPH")
+        click.echo("-" * 80)
+        for name, dependencies in report['dependency_graph'].items():
+            click.echo(f"{name} -> {', '.join(dependencies) if dependencies else '(none)'}")
+
+        click.echo("=" * 80)
+        click.echo(f"📊 Total startup (import app.main): {total * 1000:.2f} ms")
+
+        output_path = Path(output) if output else __cache_path__() / "startup_profile.json"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, indent=2))
+        click.echo(f"✅ Report written: {output_path}")
+
+    except ImportError as e:
+        click.echo(f"❌ Failed to import FastAPI app: {e}")
+        click.echo("💡 Make sure you're running this from the project root directory")
+
+
 @cli.command()
 def install():
     """Install project dependencies"""
@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Read when the application is bootstrapped (first import of app.main): one SQLite file for the whole run
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='fastie-tests-')}/test.db"
+
+from sqlalchemy import delete
+
+from app.main import app as fastapi_app  # noqa: F401  bootstraps the components
+import app.models  # noqa: F401
+from app.core.service_containers.service_containers import get_registry
+from app.infrastructures.database import Base
+from app.infrastructures.database.database_infrastructure import DatabaseInfrastructure
+from app.infrastructures.database.db_context import DbContext
+
+
+@pytest.fixture(scope="session")
+def database() -> DatabaseInfrastructure:
+    database = get_registry().resolve(DatabaseInfrastructure)
+    Base.metadata.create_all(database.engine)
+    return database
+
+
+@pytest.fixture
+def db(database):
+    """
+    The test database, emptied after the test (through the session, so the caches see the writes).
+    """
+    yield database
+    with DbContext() as db_context:
+        for table in reversed(Base.metadata.sorted_tables):
+            db_context.session.execute(delete(table))
@@ -0,0 +1,54 @@
+import asyncio
+
+from app.core.service_containers.service_containers import get_registry
+from app.infrastructures.database.db_context import AsyncDbContext, DbContext
+from app.repositories.interfaces.user.i_async_user_repository import IAsyncUserRepository
+from app.repositories.interfaces.user.i_user_repository import IUserRepository
+
+
+def _create_users(repository, count: int) -> list:
+    with DbContext():
+        return [
+            repository.create({'name': f'user{i}', 'email': f'user{i}@example.com', 'password': 'secret'}).id
+            for i in range(count)
+        ]
+
+
+def _names(repository) -> dict:
+    with DbContext():
+        return {user.id: user.name for user in repository.get_all(with_trash=True)}
+
+
+def test_update_many_rows_skips_soft_deleted_and_missing_rows(db):
+    repository = get_registry().resolve(IUserRepository)
+    live, trashed = _create_users(repository, 2)
+    with DbContext():
+        repository.delete(trashed)
+
+    with DbContext():
+        count = repository.update_many([
+            {'id': live, 'name': 'renamed'},
+            {'id': trashed, 'name': 'renamed'},
+            {'id': trashed + 100, 'name': 'renamed'},
+        ])
+
+    assert count == 1
+    assert _names(repository) == {live: 'renamed', trashed: 'user1'}
+
+
+def test_async_update_many_rows_skips_soft_deleted_rows(db):
+    repository = get_registry().resolve(IUserRepository)
+    async_repository = get_registry().resolve(IAsyncUserRepository)
+    live, trashed = _create_users(repository, 2)
+    with DbContext():
+        repository.delete(trashed)
+
+    async def update_many():
+        async with AsyncDbContext():
+            return await async_repository.update_many([
+                {'id': live, 'name': 'renamed'},
+                {'id': trashed, 'name': 'renamed'},
+            ])
+
+    assert asyncio.run(update_many()) == 1
+    assert _names(repository) == {live: 'renamed', trashed: 'user1'}
@@ -0,0 +1,23 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.infrastructures.database.connection_pool import PoolMetrics, instrumented_pool_class
+
+
+def test_snapshot_reads_the_pool_of_a_disposed_engine(tmp_path):
+    metrics = PoolMetrics("queue")
+    engine = create_engine(f"sqlite:///{tmp_path}/pool.db", poolclass=instrumented_pool_class(QueuePool, metrics))
+    metrics.attach(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    assert metrics.snapshot()["checked_in"] == 1
+
+    # As a forked worker does: the old pool and its connections are dropped
+    engine.dispose()
+    assert metrics.snapshot()["checked_in"] == 0
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert metrics.snapshot()["checked_out"] == 1
+    assert metrics.snapshot()["checked_in"] == 1
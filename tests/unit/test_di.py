@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from app.core.decorators.di import (
+    Scope, _get_lazy_proxy, _initialize_component, _initialize_in_parallel, _register_instance, build_resolution_plan,
+    component, infrastructure, service,
+)
+from app.core.service_containers.service_containers import get_registry
+
+
+@pytest.fixture(autouse=True)
+def unsealed_registry(monkeypatch):
+    # The application sealed the container at startup: the components of these tests register late
+    monkeypatch.setattr(get_registry(), '_sealed', False)
+
+built = []
+
+
+@infrastructure
+class SlowInfrastructure:
+    def __init__(self):
+        time.sleep(0.2)
+        built.append(self)
+
+
+@service
+class LazyService:
+    def __init__(self, infrastructure: SlowInfrastructure):
+        self.infrastructure = infrastructure
+
+
+@component(lazy=False)
+class EagerConsumer:
+    def __init__(self, service: LazyService):
+        # Materializes the lazy service, which needs the infrastructure
+        self.infrastructure = service.infrastructure
+
+
+def test_parallel_init_waits_for_eager_dependencies_of_lazy_dependencies():
+    built.clear()
+    build_resolution_plan([SlowInfrastructure, EagerConsumer, LazyService])
+    _register_instance(LazyService, _get_lazy_proxy(LazyService), None)
+
+    _initialize_in_parallel([SlowInfrastructure, EagerConsumer])
+
+    assert len(built) == 1
+    assert _initialize_component(EagerConsumer).infrastructure is built[0]
+
+
+@infrastructure
+class RacedInfrastructure:
+    instances = []
+
+    def __init__(self):
+        time.sleep(0.1)
+        RacedInfrastructure.instances.append(self)
+
+
+def test_concurrent_initialization_builds_one_singleton():
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(_initialize_component(RacedInfrastructure))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(RacedInfrastructure.instances) == 1
+    assert all(result is RacedInfrastructure.instances[0] for result in results)
+
+
+@service(scope=Scope.PROTOTYPE)
+class Prototype:
+    pass
+
+
+@component(lazy=False)
+class FirstPrototypeConsumer:
+    def __init__(self, prototype: Prototype):
+        self.prototype = prototype
+
+
+@component(lazy=False)
+class SecondPrototypeConsumer:
+    def __init__(self, prototype: Prototype):
+        self.prototype = prototype
+
+
+def test_lazy_prototype_is_a_new_instance_for_every_dependent():
+    first = _initialize_component(FirstPrototypeConsumer).prototype
+    second = _initialize_component(SecondPrototypeConsumer).prototype
+
+    assert type(first) is Prototype and type(second) is Prototype
+    assert first is not second
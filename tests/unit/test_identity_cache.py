@@ -0,0 +1,54 @@
+import threading
+
+import pytest
+
+from app.infrastructures.database.db_context import DbContext
+from app.models.user import User
+from app.repositories.identity_cache import MISSING, IdentityCache
+from app.repositories.implements.repository import Repository
+
+
+class CachedUserRepository(Repository):
+    identity_cache_options = {"max_size": 100, "ttl": 60, "negative_ttl": 60}
+
+
+@pytest.fixture
+def repository(db):
+    return CachedUserRepository(User)
+
+
+def test_put_skips_a_row_invalidated_since_the_read():
+    cache = IdentityCache()
+    version = cache.version
+    cache.invalidate(1)
+    cache.put(1, {'id': 1}, version)
+    assert cache.get(1) is MISSING
+
+    cache.put(1, {'id': 1}, cache.version)
+    assert cache.get(1) == {'id': 1}
+
+
+def test_read_racing_a_committed_update_is_not_cached(repository, monkeypatch):
+    with DbContext():
+        id = repository.create({'name': 'before', 'email': 'race@example.com', 'password': 'secret'}).id
+
+    def update_in_another_request():
+        with DbContext():
+            repository.update(id, {'name': 'after'})
+
+    # The reader has selected the old row; the writer commits before the reader stores it
+    put = repository.identity_cache.put
+    def put_after_concurrent_update(*args, **kwargs):
+        writer = threading.Thread(target=update_in_another_request)
+        writer.start()
+        writer.join()
+        put(*args, **kwargs)
+
+    monkeypatch.setattr(repository.identity_cache, 'put', put_after_concurrent_update)
+    with DbContext():
+        assert repository.get_by_id(id).name == 'before'
+    monkeypatch.undo()
+
+    assert repository.identity_cache.get(id) is MISSING
+    with DbContext():
+        assert repository.get_by_id(id).name == 'after'
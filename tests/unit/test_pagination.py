@@ -0,0 +1,37 @@
+import pytest
+
+from app.core.service_containers.service_containers import get_registry
+from app.infrastructures.database.db_context import DbContext
+from app.repositories.interfaces.user.i_user_repository import IUserRepository
+
+
+@pytest.fixture
+def users(db):
+    repository = get_registry().resolve(IUserRepository)
+    with DbContext():
+        # Written in the same second: DEFAULT now() gives every row the same created_at
+        return [
+            repository.create({'name': f'user{i}', 'email': f'user{i}@example.com', 'password': 'secret'}).id
+            for i in range(5)
+        ]
+
+
+def _page_through(order_by: str, order_direction: str, limit: int = 2) -> list:
+    repository = get_registry().resolve(IUserRepository)
+    ids, cursor = [], None
+    with DbContext():
+        # Bounded: a cursor that does not advance must fail the test, not hang it
+        for _ in range(10):
+            page = repository.get_page(limit=limit, cursor=cursor, order_by=order_by, order_direction=order_direction)
+            ids += [user.id for user in page.items]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+    return ids
+
+
+@pytest.mark.parametrize("order_direction", ["asc", "desc"])
+@pytest.mark.parametrize("order_by", ["id", "created_at"])
+def test_get_page_visits_every_row_once(users, order_by, order_direction):
+    expected = users if order_direction == "asc" else list(reversed(users))
+    assert _page_through(order_by, order_direction) == expected
@@ -0,0 +1,55 @@
+import gc
+import signal
+import textwrap
+import time
+
+import pytest
+
+from app.core.server.prefork_server import PreforkServer
+
+BROKEN_APP = textwrap.dedent('''
+    from contextlib import asynccontextmanager
+    from fastapi import FastAPI
+
+    @asynccontextmanager
+    async def lifespan(app):
+        raise RuntimeError("bad configuration")
+        yield
+
+    app = FastAPI(lifespan=lifespan)
+''')
+
+
+class RecordingServer(PreforkServer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.spawned_at = []
+
+    def _spawn_worker(self) -> int:
+        self.spawned_at.append(time.time())
+        return super()._spawn_worker()
+
+
+@pytest.fixture
+def broken_app(tmp_path, monkeypatch):
+    (tmp_path / "broken_app.py").write_text(BROKEN_APP)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    handlers = {signum: signal.getsignal(signum) for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP)}
+    yield "broken_app:app"
+    for signum, handler in handlers.items():
+        signal.signal(signum, handler)
+    gc.unfreeze()
+
+
+def test_workers_failing_to_boot_are_backed_off_then_given_up(broken_app):
+    server = RecordingServer(
+        broken_app, host="127.0.0.1", port=0, workers=1, max_boot_failures=3, respawn_backoff=1,
+    )
+
+    assert server.run() == 1
+
+    # Initial worker, then restarts after 1s and 2s; the third failure stops the master
+    assert len(server.spawned_at) == 3
+    delays = [later - earlier for earlier, later in zip(server.spawned_at, server.spawned_at[1:])]
+    assert delays[0] >= 1
+    assert delays[1] >= 2
@@ -0,0 +1,22 @@
+from sqlalchemy import create_engine, literal, select, text
+
+from app.infrastructures.database.connection_pool import PoolMetrics
+from app.infrastructures.database.replica_routing import ReplicaRouter, RoutingSession
+
+
+def test_only_routed_statements_are_counted():
+    primary, replica = create_engine("sqlite://"), create_engine("sqlite://")
+    router = ReplicaRouter(primary, [(replica, PoolMetrics("SingletonThreadPool"))], read_your_writes_window=0)
+    session = RoutingSession(bind=primary, router=router)
+
+    # Dialect lookups of the repositories
+    assert session.get_bind().dialect.name == "sqlite"
+    assert router.stats()["primary_reads"] == 0
+
+    session.execute(select(literal(1)))
+    session.execute(text("SELECT 1"))
+    session.close()
+
+    stats = router.stats()
+    assert stats["replica_reads"] == [1]
+    assert stats["primary_reads"] == 1
@@ -0,0 +1,52 @@
+import asyncio
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.decorators.di import (
+    Scope, _get_request_instance, async_request_scope, component, request_scope, request_scope_dependency
+)
+
+closed = []
+
+
+@component(scope=Scope.REQUEST)
+class AsyncClosingContext:
+    async def close(self):
+        await asyncio.sleep(0)
+        closed.append(self)
+
+
+def test_nested_scope_restores_the_outer_scope():
+    with request_scope():
+        outer = _get_request_instance(AsyncClosingContext)
+        with request_scope():
+            assert _get_request_instance(AsyncClosingContext) is not outer
+        assert _get_request_instance(AsyncClosingContext) is outer
+
+
+def test_async_scope_awaits_async_close():
+    closed.clear()
+
+    async def run():
+        async with async_request_scope():
+            return _get_request_instance(AsyncClosingContext)
+
+    assert closed == [asyncio.run(run())]
+
+
+def test_dependency_disposes_the_request_instances():
+    closed.clear()
+    created = []
+    app = FastAPI(dependencies=[Depends(request_scope_dependency)])
+
+    @app.get("/")
+    async def index():
+        created.append(_get_request_instance(AsyncClosingContext))
+        return {}
+
+    with TestClient(app) as client:
+        assert client.get("/").status_code == 200
+        assert client.get("/").status_code == 200
+
+    assert closed == created and len(created) == 2
@@ -0,0 +1,15 @@
+from app.core.service_containers.service_containers import get_registry
+from app.infrastructures.database.session_context import current_session, unbind_session
+from app.repositories.interfaces.user.i_user_repository import IUserRepository
+
+
+def test_set_session_binding_is_restored_with_its_token(db):
+    repository = get_registry().resolve(IUserRepository)
+    session = db.get_session()
+    try:
+        token = repository.set_session(session)
+        assert repository.session is session
+        unbind_session(token)
+        assert current_session() is None
+    finally:
+        session.close()
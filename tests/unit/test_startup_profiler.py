@@ -0,0 +1,18 @@
+from app.core.decorators.di import Scope, _get_request_instance, component, request_scope
+from app.core.profiling.startup_profiler import SECTION_COMPONENTS, get_timings, is_recording
+
+
+@component(scope=Scope.REQUEST)
+class RequestContext:
+    pass
+
+
+def test_runtime_constructions_keep_the_startup_timings():
+    startup = get_timings(SECTION_COMPONENTS)
+    assert not is_recording()
+    assert 'DatabaseInfrastructure' in [timing['name'] for timing in startup]
+
+    with request_scope():
+        _get_request_instance(RequestContext)
+
+    assert get_timings(SECTION_COMPONENTS) == startup
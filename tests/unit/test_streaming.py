@@ -0,0 +1,58 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.service_containers.service_containers import get_registry
+from app.infrastructures.database.session_context import current_async_session, current_session
+from app.services.interfaces.user.i_async_user_service import IAsyncUserService
+from app.services.interfaces.user.i_user_service import IUserService
+
+
+@pytest.fixture
+def users(db):
+    service = get_registry().resolve(IAsyncUserService)
+
+    async def create():
+        for i in range(5):
+            await service.create({'name': f'user{i}', 'email': f'user{i}@example.com', 'password': 'secret'})
+
+    asyncio.run(create())
+
+
+def _ndjson(items):
+    for item in items:
+        yield item.model_dump_json() + "\n"
+
+
+async def _async_ndjson(items):
+    async for item in items:
+        yield item.model_dump_json() + "\n"
+
+
+def _streamed_names(service_interface, encode) -> list:
+    service = get_registry().resolve(service_interface)
+    app = FastAPI()
+
+    @app.get("/export")
+    async def export():
+        # Several batches: the generator is resumed step by step by the response
+        return StreamingResponse(encode(service.stream(batch_size=2)), media_type="application/x-ndjson")
+
+    with TestClient(app) as client:
+        response = client.get("/export")
+    assert response.status_code == 200
+    return [json.loads(line)['name'] for line in response.text.splitlines()]
+
+
+def test_sync_stream_under_streaming_response(users):
+    assert _streamed_names(IUserService, _ndjson) == [f'user{i}' for i in range(5)]
+    assert current_session() is None
+
+
+def test_async_stream_under_streaming_response(users):
+    assert _streamed_names(IAsyncUserService, _async_ndjson) == [f'user{i}' for i in range(5)]
+    assert current_async_session() is None
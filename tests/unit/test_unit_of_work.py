@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from app.core.service_containers.service_containers import get_registry
+from app.infrastructures.database.unit_of_work import async_unit_of_work, current_unit_of_work, unit_of_work
+from app.services.interfaces.user.i_async_user_service import IAsyncUserService
+from app.services.interfaces.user.i_user_service import IUserService
+
+
+def _user(i: int) -> dict:
+    return {'name': f'user{i}', 'email': f'user{i}@example.com', 'password': 'secret'}
+
+
+def _emails() -> list:
+    return [user.email for user in get_registry().resolve(IUserService).get_all()]
+
+
+def test_async_unit_of_work_commits_the_async_session(db):
+    async_service = get_registry().resolve(IAsyncUserService)
+
+    async def run():
+        async with async_unit_of_work() as uow:
+            await async_service.create(_user(0))
+            await async_service.create(_user(1))
+            assert _emails() == []
+        return uow
+
+    uow = asyncio.run(run())
+
+    assert sorted(_emails()) == ['user0@example.com', 'user1@example.com']
+    assert current_unit_of_work() is None
+    assert not uow.async_session.in_transaction()
+
+
+def test_sync_unit_of_work_refuses_async_sessions(db):
+    async_service = get_registry().resolve(IAsyncUserService)
+
+    async def create():
+        await async_service.create(_user(0))
+
+    with pytest.raises(Exception, match="async_unit_of_work"):
+        with unit_of_work():
+            asyncio.run(create())
+
+    assert _emails() == []